@@ -15,6 +15,8 @@ from nepalify.dates.bs_datetime import BSDateTime
 from nepalify.dates.converter import (
     ad_to_bs,
     bs_to_ad,
+    ad_to_bs_batch,
+    bs_to_ad_batch,
     get_days_in_month,
     get_days_in_year,
     is_valid_bs_date,
@@ -40,6 +42,7 @@ from nepalify.dates.calendar import (
 )
 from nepalify.dates.parser import (
     parse,
+    parse_many,
     parse_date,
     parse_datetime,
 )
@@ -51,6 +54,8 @@ __all__ = [
     # Conversion functions
     "ad_to_bs",
     "bs_to_ad",
+    "ad_to_bs_batch",
+    "bs_to_ad_batch",
     "get_days_in_month",
     "get_days_in_year",
     "is_valid_bs_date",
@@ -74,6 +79,7 @@ __all__ = [
     "year_calendar",
     # Parsing
     "parse",
+    "parse_many",
     "parse_date",
     "parse_datetime",
 ]
@@ -6,18 +6,16 @@ Similar to Python's datetime.date but for the BS calendar.
 
 from __future__ import annotations
 from datetime import date, timedelta
-from typing import Optional, Union
+from typing import Any, Optional, Tuple, Union
 
 from nepalify.dates.converter import (
     ad_to_bs,
-    bs_to_ad,
-    get_days_in_month,
     is_valid_bs_date,
     bs_date_to_ordinal,
     ordinal_to_bs_date,
-    get_max_ordinal,
     BS_MIN_YEAR,
     BS_MAX_YEAR,
+    _AD_ORDINAL_OFFSET,
 )
 
 from nepalify.dates.format_codes import format_bs_datetime
@@ -46,7 +44,10 @@ class BSDate:
         datetime.date(2024, 2, 6)
     """
     
-    __slots__ = ('_year', '_month', '_day')
+    __slots__ = ('_year', '_month', '_day', '_ordinal', '_hash', '_last_strftime')
+    
+    # Positional fields for structural pattern matching (case BSDate(y, m, d))
+    __match_args__ = ('year', 'month', 'day')
     
     def __init__(self, year: int, month: int, day: int):
         """
@@ -69,6 +70,11 @@ class BSDate:
         self._year = year
         self._month = month
         self._day = day
+        # Derived values, computed on first use (instances are immutable)
+        self._ordinal: Optional[int] = None
+        self._hash: Optional[int] = None
+        # Last (fmt, style, result) from strftime, for repeated formatting
+        self._last_strftime: Optional[Tuple[str, str, str]] = None
     
     @property
     def year(self) -> int:
@@ -143,8 +149,7 @@ class BSDate:
             >>> bs.to_ad()
             datetime.date(2024, 2, 6)
         """
-        ad_year, ad_month, ad_day = bs_to_ad(self._year, self._month, self._day)
-        return date(ad_year, ad_month, ad_day)
+        return date.fromordinal(self.toordinal() + _AD_ORDINAL_OFFSET)
     
     def togregorian(self) -> date:
         """Alias for to_ad() for compatibility."""
@@ -169,7 +174,11 @@ class BSDate:
             >>> BSDate(2080, 10, 24).toordinal()
             65532
         """
-        return bs_date_to_ordinal(self._year, self._month, self._day)
+        ordinal = self._ordinal
+        if ordinal is None:
+            ordinal = bs_date_to_ordinal(self._year, self._month, self._day)
+            self._ordinal = ordinal
+        return ordinal
     
     @classmethod
     def fromordinal(cls, ordinal: int) -> BSDate:
@@ -195,6 +204,23 @@ class BSDate:
         year, month, day = ordinal_to_bs_date(ordinal)
         return cls(year, month, day)
     
+    @classmethod
+    def _from_ordinal(cls, ordinal: int) -> BSDate:
+        """Build a BSDate from an ordinal, seeding the cached ordinal.
+        
+        Skips re-validation since ordinal_to_bs_date() only returns
+        valid dates.
+        """
+        year, month, day = ordinal_to_bs_date(ordinal)
+        self = cls.__new__(cls)
+        self._year = year
+        self._month = month
+        self._day = day
+        self._ordinal = ordinal
+        self._hash = None
+        self._last_strftime = None
+        return self
+    
     def weekday(self) -> int:
         """
         Return the day of the week.
@@ -208,11 +234,9 @@ class BSDate:
             >>> BSDate(2080, 10, 24).weekday()
             2  # Tuesday
         """
-        # Get AD date and calculate weekday
-        ad_date = self.to_ad()
-        # Python's weekday: Monday=0, Sunday=6
-        # We want: Sunday=0, Saturday=6
-        return (ad_date.weekday() + 1) % 7
+        # Proleptic Gregorian ordinal 1 (0001-01-01) is a Monday, so
+        # ordinal % 7 counts days from Sunday (Sunday=0, Saturday=6)
+        return (self.toordinal() + _AD_ORDINAL_OFFSET) % 7
     
     def isoweekday(self) -> int:
         """
@@ -221,12 +245,15 @@ class BSDate:
         Returns:
             ISO day of week (1=Monday, 7=Sunday).
         """
-        return self.to_ad().isoweekday()
+        return (self.toordinal() + _AD_ORDINAL_OFFSET - 1) % 7 + 1
     
     def strftime(self, fmt: str, style: str = 'formal') -> str:
         """
         Format the date as a string using format codes.
         
+        The last result is kept on the instance, so formatting the same
+        date again with the same format and style returns it directly.
+        
         Supported format codes:
             Standard (English): %Y, %y, %m, %d, %B, %b, %A, %a
             Nepali (Devanagari): %K, %k, %n, %D, %N, %G, %g
@@ -247,7 +274,12 @@ class BSDate:
             >>> date.strftime("%D %N, %K")
             '२४ माघ, २०८०'
         """
-        return format_bs_datetime(self, fmt, style=style)
+        last = self._last_strftime
+        if last is not None and last[0] == fmt and last[1] == style:
+            return last[2]
+        result = format_bs_datetime(self, fmt, style=style)
+        self._last_strftime = (fmt, style, result)
+        return result
     
     def isoformat(self) -> str:
         """
@@ -303,8 +335,7 @@ class BSDate:
             return NotImplemented
         
         # Fast ordinal-based arithmetic
-        new_ordinal = self.toordinal() + days
-        return BSDate.fromordinal(new_ordinal)
+        return BSDate._from_ordinal(self.toordinal() + days)
     
     def __radd__(self, days: Union[int, timedelta]) -> BSDate:
         """Support days + date."""
@@ -383,7 +414,30 @@ class BSDate:
     
     def __hash__(self) -> int:
         """Return hash value."""
-        return hash((self._year, self._month, self._day))
+        result = self._hash
+        if result is None:
+            result = hash((self._year, self._month, self._day))
+            self._hash = result
+        return result
+    
+    def __reduce__(self) -> Tuple[type, Tuple[int, ...]]:
+        """Pickle only the date fields, never cached values or strftime output."""
+        return (type(self), (self._year, self._month, self._day))
+    
+    def __setstate__(self, state: Any) -> None:
+        """Restore pickles written before __reduce__ was defined.
+        
+        Those carry the slot values as (None, slots) state and never ran
+        __init__, so the cached values are reset here.
+        """
+        if isinstance(state, tuple):
+            state = state[1]
+        self._year = state['_year']
+        self._month = state['_month']
+        self._day = state['_day']
+        self._ordinal = None
+        self._hash = None
+        self._last_strftime = None
     
     def __repr__(self) -> str:
         """Return repr string."""
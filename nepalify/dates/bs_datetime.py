@@ -19,19 +19,20 @@ Example:
 from __future__ import annotations
 from datetime import datetime, date, time, timedelta, tzinfo as TzInfo
 import time as _time
-from typing import Optional, Union, Tuple
+from typing import Any, Optional, Union, Tuple
 
 
 from nepalify.dates.converter import (
     ad_to_bs,
     bs_to_ad,
-    get_days_in_month,
+    bs_date_to_ordinal,
     is_valid_bs_date,
     BS_MIN_YEAR,
     BS_MAX_YEAR,
+    _AD_ORDINAL_OFFSET,
 )
 from nepalify.dates.bs_date import BSDate
-from nepalify.dates.timezone import NepaliTimeZone, NPT
+from nepalify.dates.timezone import NepaliTimeZone
 
 from nepalify.dates.format_codes import format_bs_datetime
 
@@ -69,7 +70,7 @@ class BSDateTime:
     """
     
     __slots__ = ('_year', '_month', '_day', '_hour', '_minute', 
-                 '_second', '_microsecond', '_tzinfo')
+                 '_second', '_microsecond', '_tzinfo', '_hash')
     
     def __init__(
         self,
@@ -123,6 +124,7 @@ class BSDateTime:
         self._second = second
         self._microsecond = microsecond
         self._tzinfo = tzinfo
+        self._hash: Optional[int] = None  # Computed on first use
     
     # Properties
     @property
@@ -196,9 +198,9 @@ class BSDateTime:
         Returns:
             BSDateTime: Today's date at 00:00:00.
         """
-        today_ad = date.today()
+        local = _time.localtime()
         bs_year, bs_month, bs_day = ad_to_bs(
-            today_ad.year, today_ad.month, today_ad.day
+            local.tm_year, local.tm_mon, local.tm_mday
         )
         return cls(bs_year, bs_month, bs_day)
 
@@ -361,8 +363,6 @@ class BSDateTime:
             struct_time: Time tuple with BS year/month/day.
         """
         # Calculate day of year
-        from nepalify.dates.converter import bs_date_to_ordinal
-        
         ordinal = bs_date_to_ordinal(self._year, self._month, self._day)
         start_ordinal = bs_date_to_ordinal(self._year, 1, 1)
         day_of_year = ordinal - start_ordinal + 1
@@ -395,10 +395,10 @@ class BSDateTime:
             int: Day of week (0=Sunday, 1=Monday, ..., 6=Saturday).
             Note: Nepali convention starts week on Sunday.
         """
-        ad_date = date(*bs_to_ad(self._year, self._month, self._day))
-        # Python: Monday=0, Sunday=6
-        # Nepali: Sunday=0, Saturday=6
-        return (ad_date.weekday() + 1) % 7
+        # Proleptic Gregorian ordinal 1 (0001-01-01) is a Monday, so
+        # ordinal % 7 counts days from Sunday (Sunday=0, Saturday=6)
+        ordinal = bs_date_to_ordinal(self._year, self._month, self._day)
+        return (ordinal + _AD_ORDINAL_OFFSET) % 7
     
     def isoweekday(self) -> int:
         """
@@ -407,8 +407,8 @@ class BSDateTime:
         Returns:
             int: ISO day of week (1=Monday, 7=Sunday).
         """
-        ad_date = date(*bs_to_ad(self._year, self._month, self._day))
-        return ad_date.isoweekday()
+        ordinal = bs_date_to_ordinal(self._year, self._month, self._day)
+        return (ordinal + _AD_ORDINAL_OFFSET - 1) % 7 + 1
     
     # Formatting methods
     def strftime(self, fmt: str, style: str = 'formal') -> str:
@@ -602,18 +602,35 @@ class BSDateTime:
         return NotImplemented
     
     # Comparison operators
+    def _comparison_keys(
+        self, other: BSDateTime
+    ) -> Tuple[Tuple[Any, ...], Tuple[Any, ...]]:
+        """
+        Get ordering keys for self and other.
+        
+        Like datetime, values sharing a tzinfo (or both naive) are ordered
+        field by field; otherwise the Gregorian datetimes are compared so
+        that UTC offsets are honoured. Either way both keys are tuples.
+        """
+        if self._tzinfo is other._tzinfo:
+            return (
+                (self._year, self._month, self._day, self._hour,
+                 self._minute, self._second, self._microsecond),
+                (other._year, other._month, other._day, other._hour,
+                 other._minute, other._second, other._microsecond),
+            )
+        return (self.to_ad(),), (other.to_ad(),)
+    
     def __eq__(self, other: object) -> bool:
         """Check equality."""
         if isinstance(other, BSDateTime):
             return (
-                self._year == other._year and
-                self._month == other._month and
-                self._day == other._day and
-                self._hour == other._hour and
-                self._minute == other._minute and
-                self._second == other._second and
-                self._microsecond == other._microsecond and
-                self._tzinfo == other._tzinfo
+                (self._year, self._month, self._day, self._hour,
+                 self._minute, self._second, self._microsecond,
+                 self._tzinfo) ==
+                (other._year, other._month, other._day, other._hour,
+                 other._minute, other._second, other._microsecond,
+                 other._tzinfo)
             )
         return NotImplemented
     
@@ -628,34 +645,68 @@ class BSDateTime:
         """Check if less than."""
         if not isinstance(other, BSDateTime):
             return NotImplemented
-        return self.to_ad() < other.to_ad()
+        left, right = self._comparison_keys(other)
+        return left < right
     
     def __le__(self, other: BSDateTime) -> bool:
         """Check if less than or equal."""
         if not isinstance(other, BSDateTime):
             return NotImplemented
-        return self.to_ad() <= other.to_ad()
+        left, right = self._comparison_keys(other)
+        return left <= right
     
     def __gt__(self, other: BSDateTime) -> bool:
         """Check if greater than."""
         if not isinstance(other, BSDateTime):
             return NotImplemented
-        return self.to_ad() > other.to_ad()
+        left, right = self._comparison_keys(other)
+        return left > right
     
     def __ge__(self, other: BSDateTime) -> bool:
         """Check if greater than or equal."""
         if not isinstance(other, BSDateTime):
             return NotImplemented
-        return self.to_ad() >= other.to_ad()
+        left, right = self._comparison_keys(other)
+        return left >= right
     
     def __hash__(self) -> int:
         """Return hash value."""
-        return hash((
+        result = self._hash
+        if result is None:
+            result = hash((
+                self._year, self._month, self._day,
+                self._hour, self._minute, self._second, self._microsecond,
+                self._tzinfo
+            ))
+            self._hash = result
+        return result
+    
+    def __reduce__(self) -> Tuple[type, Tuple[Any, ...]]:
+        """Pickle only the datetime fields, never the cached hash."""
+        return (type(self), (
             self._year, self._month, self._day,
             self._hour, self._minute, self._second, self._microsecond,
             self._tzinfo
         ))
     
+    def __setstate__(self, state: Any) -> None:
+        """Restore pickles written before __reduce__ was defined.
+        
+        Those carry the slot values as (None, slots) state and never ran
+        __init__, so the cached hash is reset here.
+        """
+        if isinstance(state, tuple):
+            state = state[1]
+        self._year = state['_year']
+        self._month = state['_month']
+        self._day = state['_day']
+        self._hour = state['_hour']
+        self._minute = state['_minute']
+        self._second = state['_second']
+        self._microsecond = state['_microsecond']
+        self._tzinfo = state['_tzinfo']
+        self._hash = None
+    
     def __repr__(self) -> str:
         """Return repr string."""
         parts = [
@@ -708,5 +759,4 @@ class BSDateTime:
 
 __all__ = [
     "BSDateTime",
-    "TIME_PERIODS_NEPALI",
 ]
@@ -28,7 +28,7 @@ Example:
      २९  ३०  ३१
 """
 
-from typing import List, Optional
+from typing import Tuple
 
 from nepalify.dates.converter import get_days_in_month, is_valid_bs_date
 from nepalify.dates.bs_date import BSDate
@@ -41,6 +41,26 @@ from nepalify.text.constants import (
 from nepalify.numbers.devanagari import to_devanagari
 
 
+# Right-aligned day-number cells (index = day of month), built once
+_DAY_CELLS = tuple(str(day).rjust(3) for day in range(33))
+_DAY_CELLS_NEPALI = tuple(to_devanagari(str(day)).rjust(3) for day in range(33))
+
+
+def _weekday_header(day_names: Tuple[str, ...], first_weekday: int) -> str:
+    """Build the weekday header row, rotated to start at first_weekday."""
+    rotated = day_names[first_weekday:] + day_names[:first_weekday]
+    return " ".join(d.ljust(3) for d in rotated)
+
+
+# Weekday header rows for each first_weekday (0-6)
+_WEEKDAY_HEADERS = tuple(
+    _weekday_header(DAYS_ENGLISH_SHORT, first) for first in range(7)
+)
+_WEEKDAY_HEADERS_NEPALI = tuple(
+    _weekday_header(DAYS_NEPALI_SHORT, first) for first in range(7)
+)
+
+
 def month_calendar(
     year: int,
     month: int,
@@ -88,25 +108,30 @@ def month_calendar(
     first_day = BSDate(year, month, 1)
     first_weekday_of_month = first_day.weekday()
     
-    # Get today for highlighting
-    today = None
+    # Day of this month to highlight, if any
+    today_day = 0
     if highlight_today:
         today = BSDate.today()
+        if today.year == year and today.month == month:
+            today_day = today.day
     
     # Build header
     if nepali:
         month_name = MONTHS_NEPALI[month - 1]
         year_str = to_devanagari(str(year))
         header = f"{month_name} {year_str}"
-        # Rotate day names based on first_weekday
-        day_names = DAYS_NEPALI_SHORT[first_weekday:] + DAYS_NEPALI_SHORT[:first_weekday]
+        day_names = DAYS_NEPALI_SHORT
+        day_headers = _WEEKDAY_HEADERS_NEPALI
+        day_cells = _DAY_CELLS_NEPALI
     else:
         month_name = MONTHS_ENGLISH[month - 1]
         header = f"{month_name} {year}"
-        day_names = DAYS_ENGLISH_SHORT[first_weekday:] + DAYS_ENGLISH_SHORT[:first_weekday]
+        day_names = DAYS_ENGLISH_SHORT
+        day_headers = _WEEKDAY_HEADERS
+        day_cells = _DAY_CELLS
     
     # Calculate header width
-    day_width = 4 if nepali else 4
+    day_width = 4
     week_width = 7 * day_width - 1
     
     lines = []
@@ -114,13 +139,11 @@ def month_calendar(
     # Center the month/year header
     lines.append(header.center(week_width))
     
-    # Day names header
-    if nepali:
-        # Nepali day names may have varying widths
-        day_header = " ".join(d.ljust(3) for d in day_names)
+    # Day names header, rotated based on first_weekday
+    if 0 <= first_weekday <= 6:
+        lines.append(day_headers[first_weekday])
     else:
-        day_header = " ".join(d.ljust(3) for d in day_names)
-    lines.append(day_header)
+        lines.append(_weekday_header(day_names, first_weekday))
     
     # Calculate starting position
     start_pos = (first_weekday_of_month - first_weekday) % 7
@@ -129,21 +152,10 @@ def month_calendar(
     week = ['   '] * start_pos  # Leading empty cells
     
     for day in range(1, days_in_month + 1):
-        # Check if this is today
-        is_today = (highlight_today and today and 
-                    today.year == year and today.month == month and today.day == day)
-        
-        if nepali:
-            day_str = to_devanagari(str(day))
-            if is_today:
-                cell = f"[{day_str}]".rjust(4)
-            else:
-                cell = day_str.rjust(3)
+        if day == today_day:
+            cell = f"[{day_cells[day].lstrip()}]".rjust(4)
         else:
-            if is_today:
-                cell = f"[{day}]".rjust(4)
-            else:
-                cell = str(day).rjust(3)
+            cell = day_cells[day]
         
         week.append(cell)
         
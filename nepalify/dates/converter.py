@@ -7,10 +7,12 @@ Supported range: 1901 BS - 2199 BS
 
 import json
 import bisect
+import operator
+from array import array
 from functools import lru_cache
-from datetime import date, timedelta
+from datetime import date
 from pathlib import Path
-from typing import Tuple, Dict, List
+from typing import Iterable, Tuple, Dict, List
 
 # Load BS calendar data
 _DATA_PATH = Path(__file__).parent / "data" / "bs_calendar.json"
@@ -40,15 +42,12 @@ def get_days_in_month(year: int, month: int) -> int:
     Raises:
         ValueError: If year or month is out of range.
     """
-    calendar = _load_calendar_data()
-    year_str = str(year)
-    
-    if year_str not in calendar:
+    if not BS_MIN_YEAR <= year <= BS_MAX_YEAR:
         raise ValueError(f"BS year {year} not in supported range (1901-2199)")
     if not 1 <= month <= 12:
         raise ValueError(f"Month must be 1-12, got {month}")
     
-    return calendar[year_str][month - 1]
+    return _MONTH_DAYS[(year - BS_MIN_YEAR) * 12 + month - 1]
 
 
 def get_days_in_year(year: int) -> int:
@@ -61,13 +60,11 @@ def get_days_in_year(year: int) -> int:
     Returns:
         Total number of days in the year.
     """
-    calendar = _load_calendar_data()
-    year_str = str(year)
-    
-    if year_str not in calendar:
+    if not BS_MIN_YEAR <= year <= BS_MAX_YEAR:
         raise ValueError(f"BS year {year} not in supported range (1901-2199)")
     
-    return sum(calendar[year_str])
+    start = (year - BS_MIN_YEAR) * 12
+    return _CUMULATIVE_DAYS[start + 12] - _CUMULATIVE_DAYS[start]
 
 
 # Reference date for conversions
@@ -82,48 +79,93 @@ BS_MAX_YEAR = 2199
 # ============================================================================
 # Ordinal-Based Date System
 # ============================================================================
-# Pre-computed lookup tables for O(1) date lookups and fast arithmetic
+# Flat lookup tables built once at import, indexed by
+# (year - BS_MIN_YEAR) * 12 + (month - 1), for O(1) date lookups.
 
-_CUMULATIVE_DAYS_BY_YEAR: List[int] = []  # Total days before each year
-_CUMULATIVE_DAYS_BY_MONTH: Dict[int, List[int]] = {}  # Days before each month per year
-_MAX_ORDINAL: int = 0  # Maximum valid ordinal
 
-_ORDINAL_INITIALIZED = False
-
-
-def _initialize_calendar_lookup_tables() -> None:
-    """Initialize pre-computed lookup tables for O(1) date lookups.
+def _build_month_tables() -> Tuple["array[int]", "array[int]"]:
+    """Build flat month-length and cumulative-day tables.
     
-    Called automatically when ordinal functions are first used.
-    Pre-computes cumulative days for fast year/month/day lookups.
+    Returns:
+        Tuple of (month_days, cumulative_days). ``cumulative_days[i]`` is
+        the number of days before month ``i`` since BS 1901-01-01; it has
+        one trailing entry holding the total number of supported days.
     """
-    global _CUMULATIVE_DAYS_BY_YEAR, _CUMULATIVE_DAYS_BY_MONTH, _MAX_ORDINAL, _ORDINAL_INITIALIZED
-    
-    if _ORDINAL_INITIALIZED:
-        return
-    
     calendar = _load_calendar_data()
-    cumulative_days = 0
+    month_days: "array[int]" = array('B')
+    cumulative_days: "array[int]" = array('I', [0])
+    total = 0
     
     for year in range(BS_MIN_YEAR, BS_MAX_YEAR + 1):
-        year_str = str(year)
-        if year_str not in calendar:
-            break
-            
-        _CUMULATIVE_DAYS_BY_YEAR.append(cumulative_days)
-        
-        # Pre-compute cumulative days for each month in this year
-        month_cumulative = [0]  # Days before month 1 = 0
-        for month in range(1, 13):
-            month_cumulative.append(
-                month_cumulative[-1] + calendar[year_str][month - 1]
-            )
-        _CUMULATIVE_DAYS_BY_MONTH[year] = month_cumulative
-        
-        cumulative_days += sum(calendar[year_str])
+        for days in calendar[str(year)]:
+            month_days.append(days)
+            total += days
+            cumulative_days.append(total)
+    
+    return month_days, cumulative_days
+
+
+_MONTH_DAYS, _CUMULATIVE_DAYS = _build_month_tables()
+_MAX_ORDINAL: int = _CUMULATIVE_DAYS[-1]  # Maximum valid ordinal
+
+
+# ============================================================================
+# Gregorian Day Arithmetic
+# ============================================================================
+# Branch-light civil calendar <-> day count conversions (Howard Hinnant's
+# days_from_civil/civil_from_days). Days are counted from 1970-01-01 and
+# work on plain ints, avoiding a datetime.date allocation per conversion.
+
+_AD_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    """Convert a proleptic Gregorian date to days since 1970-01-01."""
+    year -= month <= 2
+    era = year // 400
+    yoe = year - era * 400                                          # [0, 399]
+    doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1  # [0, 365]
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy                   # [0, 146096]
+    return era * 146097 + doe - 719468
+
+
+def _civil_from_days(days: int) -> Tuple[int, int, int]:
+    """Convert days since 1970-01-01 to a proleptic Gregorian date."""
+    days += 719468
+    era = days // 146097
+    doe = days - era * 146097                                       # [0, 146096]
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365  # [0, 399]
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)                 # [0, 365]
+    mp = (5 * doy + 2) // 153                                       # [0, 11]
+    day = doy - (153 * mp + 2) // 5 + 1                             # [1, 31]
+    month = mp + (3 if mp < 10 else -9)                             # [1, 12]
+    return yoe + era * 400 + (month <= 2), month, day
+
+
+def _int_fields(year: int, month: int, day: int) -> Tuple[int, int, int]:
+    """Return the fields as ints, raising TypeError like date() for floats.
     
-    _MAX_ORDINAL = cumulative_days
-    _ORDINAL_INITIALIZED = True
+    Integer-like objects (anything with __index__) are converted, so the
+    result never carries a float into the cached converters.
+    """
+    if type(year) is int and type(month) is int and type(day) is int:
+        return year, month, day
+    return operator.index(year), operator.index(month), operator.index(day)
+
+
+def _is_valid_ad_date(year: int, month: int, day: int) -> bool:
+    """Check that year/month/day form a valid Gregorian date."""
+    if not 1 <= year <= 9999 or not 1 <= month <= 12:
+        return False
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 1 <= day <= 29
+    return 1 <= day <= _AD_MONTH_DAYS[month]
+
+
+_REF_AD_DAYS: int = _days_from_civil(_REF_AD.year, _REF_AD.month, _REF_AD.day)
+
+# Offset from a BS ordinal to the proleptic Gregorian ordinal of date.toordinal()
+_AD_ORDINAL_OFFSET: int = _REF_AD.toordinal() - 1
 
 
 def bs_date_to_ordinal(year: int, month: int, day: int) -> int:
@@ -151,21 +193,12 @@ def bs_date_to_ordinal(year: int, month: int, day: int) -> int:
     Raises:
         ValueError: If date is outside supported range.
     """
-    _initialize_calendar_lookup_tables()
-    
     if not BS_MIN_YEAR <= year <= BS_MAX_YEAR:
         raise ValueError(f"Year {year} outside supported range ({BS_MIN_YEAR}-{BS_MAX_YEAR})")
     if not 1 <= month <= 12:
         raise ValueError(f"Month {month} must be 1-12")
-    if year not in _CUMULATIVE_DAYS_BY_MONTH:
-        raise ValueError(f"Year {year} not in calendar data")
     
-    year_index = year - BS_MIN_YEAR
-    return (
-        _CUMULATIVE_DAYS_BY_YEAR[year_index] + 
-        _CUMULATIVE_DAYS_BY_MONTH[year][month - 1] + 
-        day
-    )
+    return _CUMULATIVE_DAYS[(year - BS_MIN_YEAR) * 12 + month - 1] + day
 
 
 def ordinal_to_bs_date(ordinal: int) -> Tuple[int, int, int]:
@@ -190,36 +223,17 @@ def ordinal_to_bs_date(ordinal: int) -> Tuple[int, int, int]:
     Raises:
         ValueError: If ordinal is outside supported range.
     """
-    import bisect
-    
-    _initialize_calendar_lookup_tables()
-    
     if ordinal < 1:
         raise ValueError(f"Ordinal {ordinal} must be >= 1")
     if ordinal > _MAX_ORDINAL:
         raise ValueError(f"Ordinal {ordinal} exceeds maximum ({_MAX_ORDINAL})")
     
-    # Binary search for year
-    year_index = bisect.bisect_right(_CUMULATIVE_DAYS_BY_YEAR, ordinal - 1) - 1
-    if year_index < 0:
-        year_index = 0
-    year = BS_MIN_YEAR + year_index
-    
-    # Calculate remaining days in that year
-    remaining_days = ordinal - _CUMULATIVE_DAYS_BY_YEAR[year_index]
-    
-    # Binary search for month
-    month_lookup = _CUMULATIVE_DAYS_BY_MONTH[year]
-    month = bisect.bisect_right(month_lookup, remaining_days - 1)
-    if month < 1:
-        month = 1
-    if month > 12:
-        month = 12
-    
-    # Calculate day
-    day = remaining_days - month_lookup[month - 1]
+    # Binary search for the month containing this ordinal
+    index = bisect.bisect_right(_CUMULATIVE_DAYS, ordinal - 1) - 1
+    year_index, month_index = divmod(index, 12)
+    day = ordinal - _CUMULATIVE_DAYS[index]
     
-    return year, month, day
+    return BS_MIN_YEAR + year_index, month_index + 1, day
 
 
 def get_max_ordinal() -> int:
@@ -228,11 +242,12 @@ def get_max_ordinal() -> int:
     Returns:
         int: Maximum ordinal (last day of BS 2199)
     """
-    _initialize_calendar_lookup_tables()
     return _MAX_ORDINAL
 
 
-@lru_cache(maxsize=1024)
+# typed=True: 2024.0 == 2024, so an untyped cache would answer float
+# arguments from int entries instead of rejecting them
+@lru_cache(maxsize=1024, typed=True)
 def ad_to_bs(year: int, month: int, day: int) -> Tuple[int, int, int]:
     """
     Convert a Gregorian (AD) date to Bikram Sambat (BS).
@@ -246,40 +261,38 @@ def ad_to_bs(year: int, month: int, day: int) -> Tuple[int, int, int]:
         Tuple of (bs_year, bs_month, bs_day).
     
     Raises:
+        TypeError: If a field is not an integer.
         ValueError: If the date is outside the supported range.
     """
-    try:
-        target_ad = date(year, month, day)
-    except ValueError as e:
-        raise ValueError(f"Invalid AD date: {year}-{month}-{day}") from e
+    year, month, day = _int_fields(year, month, day)
+    if not _is_valid_ad_date(year, month, day):
+        raise ValueError(f"Invalid AD date: {year}-{month}-{day}")
 
-    # Calculate ordinal difference
-    # BS 1901-01-01 is ordinal 1
-    # AD 1844-04-11 is reference for BS 1901-01-01
-    
-    ref_ad_ordinal = _REF_AD.toordinal()
-    target_ad_ordinal = target_ad.toordinal()
-    
-    # bs_ordinal = (target - ref) + 1
-    bs_ordinal = target_ad_ordinal - ref_ad_ordinal + 1
+    # BS 1901-01-01 is ordinal 1, AD 1844-04-11 is its reference date
+    bs_ordinal = _days_from_civil(year, month, day) - _REF_AD_DAYS + 1
     
     if bs_ordinal < 1:
-         raise ValueError(
+        raise ValueError(
             f"Date {year}-{month}-{day} is before the supported range "
             f"(starts at {_REF_AD})"
         )
-        
-    try:
-        return ordinal_to_bs_date(bs_ordinal)
-    except ValueError:
-         raise ValueError(
+    if bs_ordinal > _MAX_ORDINAL:
+        raise ValueError(
             f"Date {year}-{month}-{day} is beyond the supported range "
             f"(BS 1901-2199)"
         )
+    
+    # Range already checked above; index the month table directly
+    index = bisect.bisect_right(_CUMULATIVE_DAYS, bs_ordinal - 1) - 1
+    year_index, month_index = divmod(index, 12)
+    return (
+        BS_MIN_YEAR + year_index,
+        month_index + 1,
+        bs_ordinal - _CUMULATIVE_DAYS[index],
+    )
 
 
-
-@lru_cache(maxsize=1024)
+@lru_cache(maxsize=1024, typed=True)
 def bs_to_ad(year: int, month: int, day: int) -> Tuple[int, int, int]:
     """
     Convert a Bikram Sambat (BS) date to Gregorian (AD).
@@ -293,22 +306,136 @@ def bs_to_ad(year: int, month: int, day: int) -> Tuple[int, int, int]:
         Tuple of (ad_year, ad_month, ad_day).
     
     Raises:
+        TypeError: If a field is not an integer.
         ValueError: If the date is outside the supported range or invalid.
     """
-    # Get ordinal (validates input)
-    bs_ordinal = bs_date_to_ordinal(year, month, day)
+    year, month, day = _int_fields(year, month, day)
+    if not BS_MIN_YEAR <= year <= BS_MAX_YEAR:
+        raise ValueError(f"Year {year} outside supported range ({BS_MIN_YEAR}-{BS_MAX_YEAR})")
+    if not 1 <= month <= 12:
+        raise ValueError(f"Month {month} must be 1-12")
+    
+    # BS ordinal 1 falls on _REF_AD, so day offsets line up one-to-one
+    offset = _CUMULATIVE_DAYS[(year - BS_MIN_YEAR) * 12 + month - 1] + day - 1
+    return _civil_from_days(_REF_AD_DAYS + offset)
+
+
+def _parallel_fields(
+    years: Iterable[int],
+    months: Iterable[int],
+    days: Iterable[int]
+) -> Tuple[List[int], List[int], List[int]]:
+    """Materialise parallel field inputs, rejecting mismatched lengths."""
+    years, months, days = list(years), list(months), list(days)
+    if not len(years) == len(months) == len(days):
+        raise ValueError(
+            f"years, months and days must have the same length, got "
+            f"{len(years)}, {len(months)} and {len(days)}"
+        )
+    return years, months, days
+
+
+def ad_to_bs_batch(
+    years: Iterable[int],
+    months: Iterable[int],
+    days: Iterable[int]
+) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Convert many Gregorian (AD) dates to Bikram Sambat (BS) at once.
     
-    # Calculate AD date
-    # bs_ordinal 1 = _REF_AD
-    # ad_ordinal = ref_ad_ordinal + bs_ordinal - 1
+    Equivalent to calling ad_to_bs() on each (year, month, day) triple,
+    but without per-call cache lookups. Runs of nearby dates (e.g. a
+    calendar grid or a sorted report) reuse the month found for the
+    previous date instead of searching the month table again.
     
-    ref_ad_ordinal = _REF_AD.toordinal()
-    ad_ordinal = ref_ad_ordinal + bs_ordinal - 1
+    Args:
+        years: Gregorian years.
+        months: Gregorian months (1-12), parallel to years.
+        days: Gregorian days, parallel to years.
     
-    ad_date = date.fromordinal(ad_ordinal)
+    Returns:
+        Tuple of (bs_years, bs_months, bs_days) lists in input order.
     
-    return (ad_date.year, ad_date.month, ad_date.day)
-
+    Examples:
+        >>> ad_to_bs_batch([2024, 2024], [2, 2], [6, 7])
+        ([2080, 2080], [10, 10], [23, 24])
+    
+    Raises:
+        TypeError: If any field is not an integer.
+        ValueError: If the inputs differ in length, or any date is invalid
+            or outside the supported range.
+    """
+    years, months, days = _parallel_fields(years, months, days)
+    cumulative = _CUMULATIVE_DAYS
+    bs_years: List[int] = []
+    bs_months: List[int] = []
+    bs_days: List[int] = []
+    index = 0
+    
+    for year, month, day in zip(years, months, days):
+        year, month, day = _int_fields(year, month, day)
+        if not _is_valid_ad_date(year, month, day):
+            ad_to_bs(year, month, day)  # raises with the standard message
+        days_before = _days_from_civil(year, month, day) - _REF_AD_DAYS
+        if not 0 <= days_before < _MAX_ORDINAL:
+            ad_to_bs(year, month, day)  # raises with the standard message
+        
+        # Reuse the previous month when the date still falls inside it
+        if not cumulative[index] <= days_before < cumulative[index + 1]:
+            index = bisect.bisect_right(cumulative, days_before) - 1
+        year_index, month_index = divmod(index, 12)
+        bs_years.append(BS_MIN_YEAR + year_index)
+        bs_months.append(month_index + 1)
+        bs_days.append(days_before - cumulative[index] + 1)
+    
+    return bs_years, bs_months, bs_days
+
+
+def bs_to_ad_batch(
+    years: Iterable[int],
+    months: Iterable[int],
+    days: Iterable[int]
+) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Convert many Bikram Sambat (BS) dates to Gregorian (AD) at once.
+    
+    Equivalent to calling bs_to_ad() on each (year, month, day) triple,
+    but without per-call cache lookups.
+    
+    Args:
+        years: BS years (1901-2199).
+        months: BS months (1-12), parallel to years.
+        days: BS days, parallel to years.
+    
+    Returns:
+        Tuple of (ad_years, ad_months, ad_days) lists in input order.
+    
+    Examples:
+        >>> bs_to_ad_batch([2080, 2080], [10, 10], [23, 24])
+        ([2024, 2024], [2, 2], [6, 7])
+    
+    Raises:
+        TypeError: If any field is not an integer.
+        ValueError: If the inputs differ in length, or any date is outside
+            the supported range.
+    """
+    years, months, days = _parallel_fields(years, months, days)
+    cumulative = _CUMULATIVE_DAYS
+    ad_years: List[int] = []
+    ad_months: List[int] = []
+    ad_days: List[int] = []
+    
+    for year, month, day in zip(years, months, days):
+        year, month, day = _int_fields(year, month, day)
+        if not BS_MIN_YEAR <= year <= BS_MAX_YEAR or not 1 <= month <= 12:
+            bs_to_ad(year, month, day)  # raises with the standard message
+        offset = cumulative[(year - BS_MIN_YEAR) * 12 + month - 1] + day - 1
+        ad_year, ad_month, ad_day = _civil_from_days(_REF_AD_DAYS + offset)
+        ad_years.append(ad_year)
+        ad_months.append(ad_month)
+        ad_days.append(ad_day)
+    
+    return ad_years, ad_months, ad_days
 
 
 def is_valid_bs_date(year: int, month: int, day: int) -> bool:
@@ -324,15 +451,8 @@ def is_valid_bs_date(year: int, month: int, day: int) -> bool:
         True if the date is valid, False otherwise.
     """
     try:
-        calendar = _load_calendar_data()
-        year_str = str(year)
-        
-        if year_str not in calendar:
+        if not BS_MIN_YEAR <= year <= BS_MAX_YEAR or not 1 <= month <= 12:
             return False
-        if not 1 <= month <= 12:
-            return False
-        
-        days_in_month = calendar[year_str][month - 1]
-        return 1 <= day <= days_in_month
-    except Exception:
+        return 1 <= day <= _MONTH_DAYS[(year - BS_MIN_YEAR) * 12 + month - 1]
+    except TypeError:
         return False
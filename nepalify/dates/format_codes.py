@@ -10,8 +10,9 @@ Supports all standard datetime format codes plus Nepali-specific codes:
 - %G: Nepali weekday name (आइतबार, सोमबार, ...)
 """
 
-from typing import Callable, Dict, Union, TYPE_CHECKING
-from nepalify.numbers.devanagari import to_devanagari
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+from nepalify.numbers.devanagari import _EN_TO_NP, to_devanagari
 from nepalify.text.constants import (
     DAYS_ENGLISH, DAYS_ENGLISH_SHORT,
     DAYS_NEPALI, DAYS_NEPALI_SHORT,
@@ -27,16 +28,32 @@ if TYPE_CHECKING:
 # Type alias
 FormatFunc = Callable[[Union['BSDate', 'BSDateTime']], str]
 
+# Zero-padded Devanagari strings for two-digit fields (day, month, time)
+# and four-digit years in the supported calendar range
+_DEV2 = tuple(f"{i:02d}".translate(_EN_TO_NP) for i in range(100))
+_DEV4 = {y: f"{y:04d}".translate(_EN_TO_NP) for y in range(1901, 2201)}
+
+def _devanagari_year(year: int) -> str:
+    """Get the zero-padded Devanagari year, falling back for unusual years."""
+    result = _DEV4.get(year)
+    if result is None:
+        result = to_devanagari(f"{year:04d}")
+    return result
+
+# Nepali time period for each hour of the day (0-23)
+_HOUR_TO_PERIOD = (
+    (TIME_PERIODS_NEPALI['night'],) * 4         # 0:00 - 3:59
+    + (TIME_PERIODS_NEPALI['morning'],) * 8     # 4:00 - 11:59
+    + (TIME_PERIODS_NEPALI['afternoon'],) * 4   # 12:00 - 15:59
+    + (TIME_PERIODS_NEPALI['evening'],) * 4     # 16:00 - 19:59
+    + (TIME_PERIODS_NEPALI['night'],) * 4       # 20:00 - 23:59
+)
+
 def get_nepali_time_period(hour: int) -> str:
     """Get Nepali time period name based on hour of day."""
-    if 4 <= hour < 12:
-        return TIME_PERIODS_NEPALI['morning']
-    elif 12 <= hour < 16:
-        return TIME_PERIODS_NEPALI['afternoon']
-    elif 16 <= hour < 20:
-        return TIME_PERIODS_NEPALI['evening']
-    else:
-        return TIME_PERIODS_NEPALI['night']
+    if 0 <= hour < 24:
+        return _HOUR_TO_PERIOD[hour]
+    return TIME_PERIODS_NEPALI['night']
 
 def format_timezone_offset(date_obj) -> str:
     """Format timezone offset as string like +0545."""
@@ -90,22 +107,79 @@ STANDARD_CODES: Dict[str, FormatFunc] = {
 
 # Nepali-specific format codes
 NEPALI_CODES: Dict[str, FormatFunc] = {
-    '%D': lambda o: to_devanagari(f"{o.day:02d}"),  # Devanagari day
-    '%n': lambda o: to_devanagari(f"{o.month:02d}"),  # Devanagari month number
+    '%D': lambda o: _DEV2[o.day],  # Devanagari day
+    '%n': lambda o: _DEV2[o.month],  # Devanagari month number
     '%N': lambda o: MONTHS_NEPALI[o.month - 1],  # Nepali month name
-    '%K': lambda o: to_devanagari(f"{o.year:04d}"),  # Devanagari year
-    '%k': lambda o: to_devanagari(f"{o.year % 100:02d}"),  # Devanagari short year
+    '%K': lambda o: _devanagari_year(o.year),  # Devanagari year
+    '%k': lambda o: _DEV2[o.year % 100],  # Devanagari short year
     '%G': lambda o: DAYS_NEPALI[o.weekday()],  # Nepali weekday
     '%g': lambda o: DAYS_NEPALI_SHORT[o.weekday()],  # Short Nepali weekday
-    '%h': lambda o: to_devanagari(f"{getattr(o, 'hour', 0):02d}"),  # Devanagari hour
-    '%i': lambda o: to_devanagari(f"{getattr(o, 'minute', 0):02d}"),  # Devanagari minute
-    '%s': lambda o: to_devanagari(f"{getattr(o, 'second', 0):02d}"),  # Devanagari second
+    '%h': lambda o: _DEV2[getattr(o, 'hour', 0)],  # Devanagari hour
+    '%i': lambda o: _DEV2[getattr(o, 'minute', 0)],  # Devanagari minute
+    '%s': lambda o: _DEV2[getattr(o, 'second', 0)],  # Devanagari second
     '%P': lambda o: get_nepali_time_period(getattr(o, 'hour', 0)),  # Nepali period
 }
 
 # Combined lookup (standard + Nepali)
 ALL_FORMAT_CODES = {**STANDARD_CODES, **NEPALI_CODES}
 
+# Style-dependent overrides
+_SANSKRIT_CODES: Dict[str, FormatFunc] = {
+    '%N': lambda o: MONTHS_NEPALI_SANSKRIT[o.month - 1],
+}
+
+# A compiled format is a sequence of (text, formatter) pairs. Literal runs
+# have formatter None; for codes, text is the code itself (e.g. '%Y'),
+# emitted unchanged if the formatter does not apply to the object.
+CompiledFormat = Tuple[Tuple[str, Optional[FormatFunc]], ...]
+
+
+@lru_cache(maxsize=256)
+def _compile_format(fmt: str, style: str = 'formal') -> CompiledFormat:
+    """Split a format string once into literal runs and code formatters.
+    
+    Args:
+        fmt: Format string with % codes.
+        style: Month name style ('formal' or 'sanskrit').
+    
+    Returns:
+        Tuple of (text, formatter) pairs in output order.
+    """
+    codes = ALL_FORMAT_CODES
+    if style == 'sanskrit':
+        codes = {**ALL_FORMAT_CODES, **_SANSKRIT_CODES}
+    
+    parts: List[Tuple[str, Optional[FormatFunc]]] = []
+    literal: List[str] = []
+    i = 0
+    length = len(fmt)
+    
+    while i < length:
+        code = fmt[i:i + 2]
+        if code == '%%':
+            literal.append('%')
+            i += 2
+            continue
+        
+        formatter = codes.get(code)
+        if formatter is None:
+            # Plain character or unknown code: keep as literal text
+            literal.append(fmt[i])
+            i += 1
+            continue
+        
+        if literal:
+            parts.append((''.join(literal), None))
+            literal = []
+        parts.append((code, formatter))
+        i += 2
+    
+    if literal:
+        parts.append((''.join(literal), None))
+    
+    return tuple(parts)
+
+
 def format_bs_datetime(
     date_obj: Union['BSDate', 'BSDateTime'], 
     fmt: str, 
@@ -113,6 +187,9 @@ def format_bs_datetime(
 ) -> str:
     """Format BS date/datetime using format codes.
     
+    The format string is compiled once per (fmt, style) pair and cached,
+    so repeated calls only evaluate the code formatters.
+    
     Args:
         date_obj: BSDate or BSDateTime instance.
         fmt: Format string with % codes.
@@ -129,34 +206,20 @@ def format_bs_datetime(
         >>> format_bs_datetime(dt, '%D %N, %K')
         '२४ माघ, २०८०'
     """
-    result = fmt
-    
-    # Process format codes
-    # We iterate over the format string to find codes, rather than iterating over all codes
-    # This is more efficient for long format strings or many codes
-    
     # Optimization: Check if string has any % before processing
-    if '%' not in result:
-        return result
+    if '%' not in fmt:
+        return fmt
     
-    # Helper to avoid repeated getattr calls
-    # (Not strictly necessary given lambda structure but good for future optimization)
+    pieces: List[str] = []
+    append = pieces.append
+    for text, formatter in _compile_format(fmt, style):
+        if formatter is None:
+            append(text)
+            continue
+        try:
+            append(formatter(date_obj))
+        except Exception:
+            # Code not applicable (e.g. invalid date state): leave it as-is
+            append(text)
     
-    for code, formatter in ALL_FORMAT_CODES.items():
-        if code in result:
-            try:
-                # Handle style-dependent codes
-                if code == '%N' and style == 'sanskrit':
-                    value = MONTHS_NEPALI_SANSKRIT[date_obj.month - 1]
-                else:
-                    value = formatter(date_obj)
-                
-                result = result.replace(code, value)
-            except AttributeError:
-                # Code not applicable (e.g., %H for BSDate)
-                pass
-            except Exception:
-                # Fallback for any other errors (e.g. invalid date state)
-                pass
-                
-    return result
+    return ''.join(pieces)
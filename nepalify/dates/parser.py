@@ -22,89 +22,72 @@ Example:
 """
 
 import re
-from typing import Union, Optional, Dict, List, Tuple
+from typing import Iterable, List, Optional, Union, Tuple
 from functools import lru_cache
 
 
+from nepalify.dates.bs_date import BSDate
+from nepalify.dates.bs_datetime import BSDateTime
 from nepalify.dates.converter import is_valid_bs_date
-from nepalify.numbers.devanagari import from_devanagari
-from nepalify.text.constants import (
-    MONTHS_ENGLISH,
-    MONTHS_NEPALI,
-    MONTHS_NEPALI_SANSKRIT,
-)
+from nepalify.numbers.devanagari import _NP_TO_EN
+from nepalify.text.constants import _NAME_TO_MONTH
 
 
-# Month name mappings (lowercase for case-insensitive matching)
-_MONTH_NAME_TO_NUM: Dict[str, int] = {}
+# Date patterns, compiled once at import and tried in this order
 
-# Add English month names (standard)
-for i, name in enumerate(MONTHS_ENGLISH, 1):
-    _MONTH_NAME_TO_NUM[name.lower()] = i
-    # Add short forms (first 3 letters)
-    _MONTH_NAME_TO_NUM[name[:3].lower()] = i
+# ISO date with optional time: 2079-02-15, 2079/02/15, 2079-02-15 15:23:45.5,
+# 2079-02-15T15:23, 2079-02-15 5:23 PM. Tried first: numeric dates are by
+# far the most common input, and a hit skips the named-month patterns.
+_RE_ISO = re.compile(
+    r'^(\d{4})[-/](\d{1,2})[-/](\d{1,2})'
+    r'(?:(?:\s+|T)(\d{1,2}):(\d{2})(?::(\d{2}))?(?:\.(\d+))?(?:\s*(AM|PM|am|pm))?)?$'
+)
 
-# Add Nepali month names (formal)
-for i, name in enumerate(MONTHS_NEPALI, 1):
-    _MONTH_NAME_TO_NUM[name] = i
+# Every known month name as one alternation, longest first so that a full
+# name is never cut short by its abbreviation
+_MONTH_ALTERNATION = '|'.join(
+    re.escape(name) for name in sorted(_NAME_TO_MONTH, key=len, reverse=True)
+)
 
-# Add Nepali month names (Sanskrit)
-for i, name in enumerate(MONTHS_NEPALI_SANSKRIT, 1):
-    _MONTH_NAME_TO_NUM[name] = i
+# Named month (English or Nepali): Jestha 15, 2079 or माघ 15 2079
+_RE_NAMED_MONTH = re.compile(
+    rf'^({_MONTH_ALTERNATION})\s+(\d{{1,2}}),?\s+(\d{{4}})$', re.IGNORECASE
+)
 
-# Common date patterns (order matters - more specific first)
-_DATE_PATTERNS: List[Tuple[re.Pattern, str]] = [
-    # ISO format with time: 2079-02-15 15:23:45
-    (re.compile(r'^(\d{4})[-/](\d{1,2})[-/](\d{1,2})\s+(\d{1,2}):(\d{2})(?::(\d{2}))?(?:\.(\d+))?$'), 'datetime'),
-    
-    # ISO format date only: 2079-02-15 or 2079/02/15
-    (re.compile(r'^(\d{4})[-/](\d{1,2})[-/](\d{1,2})$'), 'date'),
-    
-    # Named month: Jestha 15, 2079 or Jestha 15 2079
-    (re.compile(r'^([A-Za-z]+)\s+(\d{1,2})(?:,?\s+)(\d{4})$'), 'named_month'),
-    
-    # Named month (Nepali): माघ 15, 2079
-    (re.compile(r'^([^\d\s]+)\s+(\d{1,2})(?:,?\s+)(\d{4})$'), 'named_month'),
-    
-    # Day Month Year: 15 Jestha 2079
-    (re.compile(r'^(\d{1,2})\s+([A-Za-z]+)(?:,?\s+)(\d{4})$'), 'day_month_year'),
-    
-    # Time with AM/PM: 2079-02-15 5:23 AM
-    (re.compile(r'^(\d{4})[-/](\d{1,2})[-/](\d{1,2})\s+(\d{1,2}):(\d{2})\s*(AM|PM|am|pm)$'), 'datetime_ampm'),
-    
-    # Short year: 79-02-15
-    (re.compile(r'^(\d{2})[-/](\d{1,2})[-/](\d{1,2})$'), 'short_year'),
-]
+# Day Month Year: 15 Jestha 2079 or 15 माघ, 2079
+_RE_DAY_FIRST = re.compile(
+    rf'^(\d{{1,2}})\s+({_MONTH_ALTERNATION}),?\s+(\d{{4}})$', re.IGNORECASE
+)
 
+# Short year: 79-02-15
+_RE_SHORT_YEAR = re.compile(r'^(\d{2})[-/](\d{1,2})[-/](\d{1,2})$')
 
-def _normalize_nepali_digits(text: str) -> str:
-    """Convert any Nepali digits in text to ASCII digits."""
-    return from_devanagari(text)
+# AM/PM markers accepted by _RE_ISO and %p, as sets for membership tests
+_MERIDIEMS = frozenset(('AM', 'PM', 'am', 'pm'))
+_PM_MARKERS = frozenset(('PM', 'pm'))
 
 
-def _parse_month_name(name: str) -> Optional[int]:
+def _to_24_hour(hour: int, meridiem: str) -> int:
     """
-    Parse month name to month number.
+    Convert a 12-hour clock hour and AM/PM marker to a 24-hour clock hour.
     
-    Args:
-        name: Month name (English or Nepali).
+    hour % 12 folds 12 onto 0, so 12 AM is 0 and 12 PM is 12 without
+    special cases.
     
-    Returns:
-        Month number (1-12) or None if not found.
+    Raises:
+        ValueError: If hour is above 12.
     """
-    # Try exact match first (for Nepali)
-    if name in _MONTH_NAME_TO_NUM:
-        return _MONTH_NAME_TO_NUM[name]
-    
-    # Try lowercase for English
-    name_lower = name.lower()
-    if name_lower in _MONTH_NAME_TO_NUM:
-        return _MONTH_NAME_TO_NUM[name_lower]
-    
-    return None
+    if hour > 12:
+        raise ValueError(f"Hour must be 0-12 with AM/PM, got {hour}")
+    return hour % 12 + (12 if meridiem in _PM_MARKERS else 0)
 
 
-def parse(date_string: str) -> Union['BSDate', 'BSDateTime']:
+def _normalize_nepali_digits(text: str) -> str:
+    """Convert any Nepali digits in text to ASCII digits."""
+    return text.translate(_NP_TO_EN)
+
+
+def parse(date_string: str) -> Union[BSDate, BSDateTime]:
     """
     Auto-detect and parse a date/datetime string.
     
@@ -112,7 +95,7 @@ def parse(date_string: str) -> Union['BSDate', 'BSDateTime']:
     - ISO format: 2079-02-15
     - Nepali numerals: २०७८-०१-१८
     - Named months: Jestha 15, 2079 or 15 Jestha, 2079
-    - With time: 2079-02-15 15:23 or 2079-02-15 5:23 AM
+    - With time: 2079-02-15 15:23, 2079-02-15T15:23 or 2079-02-15 5:23 AM
     
     Args:
         date_string: String to parse.
@@ -133,77 +116,84 @@ def parse(date_string: str) -> Union['BSDate', 'BSDateTime']:
         >>> parse("Jestha 15, 2079")
         BSDate(2079, 2, 15)
     """
-    # Import here to avoid circular imports
-    from nepalify.dates.bs_date import BSDate
-    from nepalify.dates.bs_datetime import BSDateTime
-    
-    # Normalize: strip whitespace and convert Nepali digits
-    text = date_string.strip()
-    normalized = _normalize_nepali_digits(text)
-    
-    # Try each pattern
-    for pattern, pattern_type in _DATE_PATTERNS:
-        match = pattern.match(normalized)
-        if not match:
-            continue
-        
-        try:
-            if pattern_type == 'date':
-                year, month, day = map(int, match.groups())
-                if is_valid_bs_date(year, month, day):
+    # Normalize: strip whitespace and convert Nepali digits. isascii() is a
+    # constant-time flag check, so plain ASCII input skips the translate.
+    normalized = date_string.strip()
+    if not normalized.isascii():
+        normalized = normalized.translate(_NP_TO_EN)
+    
+    try:
+        match = _RE_ISO.match(normalized)
+        if match:
+            year_s, month_s, day_s, hour_s, minute_s, second_s, micro_s, ampm = match.groups()
+            year, month, day = int(year_s), int(month_s), int(day_s)
+            if is_valid_bs_date(year, month, day):
+                if hour_s is None:
                     return BSDate(year, month, day)
-            
-            elif pattern_type == 'datetime':
-                groups = match.groups()
-                year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
-                hour, minute = int(groups[3]), int(groups[4])
-                second = int(groups[5]) if groups[5] else 0
-                microsecond = int(groups[6]) if groups[6] else 0
                 
-                if is_valid_bs_date(year, month, day):
-                    return BSDateTime(year, month, day, hour, minute, second, microsecond)
-            
-            elif pattern_type == 'datetime_ampm':
-                groups = match.groups()
-                year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
-                hour, minute = int(groups[3]), int(groups[4])
-                ampm = groups[5].upper()
-                
-                # Convert 12-hour to 24-hour
-                if ampm == 'PM' and hour != 12:
-                    hour += 12
-                elif ampm == 'AM' and hour == 12:
-                    hour = 0
+                hour = int(hour_s)
+                if ampm:
+                    hour = _to_24_hour(hour, ampm)
                 
-                if is_valid_bs_date(year, month, day):
-                    return BSDateTime(year, month, day, hour, minute, 0)
-            
-            elif pattern_type == 'named_month':
-                month_name, day, year = match.groups()
-                month = _parse_month_name(month_name)
-                if month and is_valid_bs_date(int(year), month, int(day)):
-                    return BSDate(int(year), month, int(day))
+                return BSDateTime(
+                    year, month, day, hour, int(minute_s),
+                    int(second_s) if second_s else 0,
+                    int(micro_s) if micro_s else 0,
+                )
+        else:
+            match = _RE_NAMED_MONTH.match(normalized)
+            if match:
+                month_name, day_s, year_s = match.groups()
+            else:
+                match = _RE_DAY_FIRST.match(normalized)
+                if match:
+                    day_s, month_name, year_s = match.groups()
             
-            elif pattern_type == 'day_month_year':
-                day, month_name, year = match.groups()
-                month = _parse_month_name(month_name)
-                if month and is_valid_bs_date(int(year), month, int(day)):
-                    return BSDate(int(year), month, int(day))
-            
-            elif pattern_type == 'short_year':
-                year, month, day = map(int, match.groups())
-                # Assume 2000s for 2-digit years
-                year = 2000 + year if year < 50 else 1900 + year
-                if is_valid_bs_date(year, month, day):
-                    return BSDate(year, month, day)
-        
-        except (ValueError, TypeError):
-            continue
+            if match:
+                # IGNORECASE also admits case-fold variants (e.g. 'ſ' for
+                # 's') that lower() does not map back to a known name
+                named_month = _NAME_TO_MONTH.get(month_name.lower())
+                year, day = int(year_s), int(day_s)
+                if named_month is not None and is_valid_bs_date(year, named_month, day):
+                    return BSDate(year, named_month, day)
+            else:
+                match = _RE_SHORT_YEAR.match(normalized)
+                if match:
+                    year, month, day = map(int, match.groups())
+                    # Assume 2000s for 2-digit years
+                    year = 2000 + year if year < 50 else 1900 + year
+                    if is_valid_bs_date(year, month, day):
+                        return BSDate(year, month, day)
+    
+    except (ValueError, TypeError):
+        pass
     
     raise ValueError(f"Could not parse date string: '{date_string}'")
 
 
-def parse_date(date_string: str) -> 'BSDate':
+def parse_many(date_strings: Iterable[str]) -> List[Union[BSDate, BSDateTime]]:
+    """
+    Parse many date/datetime strings at once.
+    
+    Equivalent to calling parse() on each string, collected in one list.
+    
+    Args:
+        date_strings: Strings to parse.
+    
+    Returns:
+        List of BSDate/BSDateTime objects in input order.
+    
+    Raises:
+        ValueError: If any string cannot be parsed.
+    
+    Examples:
+        >>> parse_many(["2079-02-15", "Jestha 16, 2079"])
+        [BSDate(2079, 2, 15), BSDate(2079, 2, 16)]
+    """
+    return [parse(date_string) for date_string in date_strings]
+
+
+def parse_date(date_string: str) -> BSDate:
     """
     Parse a date string to BSDate.
     
@@ -218,17 +208,14 @@ def parse_date(date_string: str) -> 'BSDate':
     Raises:
         ValueError: If parsing fails.
     """
-    from nepalify.dates.bs_date import BSDate
-    from nepalify.dates.bs_datetime import BSDateTime
-    
     result = parse(date_string)
     
-    if isinstance(result, BSDateTime):
-        return result.to_date()
-    return result
+    if isinstance(result, BSDate):
+        return result
+    return result.to_date()
 
 
-def parse_datetime(date_string: str) -> 'BSDateTime':
+def parse_datetime(date_string: str) -> BSDateTime:
     """
     Parse a datetime string to BSDateTime.
     
@@ -243,76 +230,156 @@ def parse_datetime(date_string: str) -> 'BSDateTime':
     Raises:
         ValueError: If parsing fails.
     """
-    from nepalify.dates.bs_date import BSDate
-    from nepalify.dates.bs_datetime import BSDateTime
-    
     result = parse(date_string)
     
-    if isinstance(result, BSDate):
-        return BSDateTime(result.year, result.month, result.day)
-    return result
+    if isinstance(result, BSDateTime):
+        return result
+    return BSDateTime(result.year, result.month, result.day)
 
 
 # Format code patterns for strftime/strptime
-# Maps format codes to regex patterns
+# Maps format codes to regex patterns; each code captures one group
 _FORMAT_CODE_PATTERNS = {
     # Date
-    '%Y': r'(?P<Y>\d{4})',              # 2080
-    '%y': r'(?P<y>\d{2})',              # 80
-    '%m': r'(?P<m>\d{1,2})',            # 01-12
-    '%d': r'(?P<d>\d{1,2})',            # 01-32
+    '%Y': r'(\d{4})',                  # 2080
+    '%y': r'(\d{2})',                  # 80
+    '%m': r'(\d{1,2})',                # 01-12
+    '%d': r'(\d{1,2})',                # 01-32
     # Nepali Date
-    '%K': r'(?P<K>[०-९]{4})',           # २०८०
-    '%k': r'(?P<k>[०-९]{2})',           # ८०
-    '%n': r'(?P<n>[०-९]{1,2})',         # ०१-१२
-    '%D': r'(?P<D>[०-९]{1,2})',         # ०१-३२
+    '%K': r'([०-९]{4})',               # २०८०
+    '%k': r'([०-९]{2})',               # ८०
+    '%n': r'([०-९]{1,2})',             # ०१-१२
+    '%D': r'([०-९]{1,2})',             # ०१-३२
     # Time
-    '%H': r'(?P<H>\d{1,2})',            # 00-23
-    '%I': r'(?P<I>\d{1,2})',            # 01-12
-    '%M': r'(?P<M>\d{1,2})',            # 00-59
-    '%S': r'(?P<S>\d{1,2})',            # 00-59
-    '%f': r'(?P<f>\d{1,6})',            # 000000
-    '%p': r'(?P<p>AM|PM|am|pm)',        # AM/PM
+    '%H': r'(\d{1,2})',                # 00-23
+    '%I': r'(\d{1,2})',                # 01-12
+    '%M': r'(\d{1,2})',                # 00-59
+    '%S': r'(\d{1,2})',                # 00-59
+    '%f': r'(\d{1,6})',                # 000000
+    '%p': r'(AM|PM|am|pm)',            # AM/PM
     # Nepali Time
-    '%h': r'(?P<h>[०-९]{1,2})',         # ००-२३
-    '%i': r'(?P<i>[०-९]{1,2})',         # ००-५९
-    '%s': r'(?P<s>[०-९]{1,2})',         # ००-५९
-    '%P': r'(?P<P>बिहान|दिउँसो|बेलुका|राति)', # Nepali period
-    # Literal
-    '%%': r'%',
+    '%h': r'([०-९]{1,2})',             # ००-२३
+    '%i': r'([०-९]{1,2})',             # ००-५९
+    '%s': r'([०-९]{1,2})',             # ००-५९
+    '%P': r'(बिहान|दिउँसो|बेलुका|राति)',  # Nepali period
 }
 
 
-@lru_cache(maxsize=128)
-def _compile_format(fmt: str) -> re.Pattern:
-
+@lru_cache(maxsize=256)
+def _compile_format(fmt: str) -> Tuple[re.Pattern, Tuple[str, ...]]:
     """
     Compile a strftime format string into a regex pattern.
     
+    The format is tokenised once: each code becomes a capturing group,
+    '%%' a literal '%', spaces match any run of whitespace, and all other
+    characters match literally.
+    
     Args:
         fmt: Format string (e.g. "%Y-%m-%d").
     
     Returns:
-        Compiled regex pattern.
+        Tuple of (compiled regex, directive letters in group order).
     """
-    pattern_str = re.escape(fmt)
-    
-    # Replace escaped format codes with regex patterns
-    for code, regex in _FORMAT_CODE_PATTERNS.items():
-        # Using negative lookbehind to ensure we don't match escaped %
-        # But re.escape escapes %, so we look for \%Y
-        escaped_code = re.escape(code)
-        # We need to replace the escaped code with the regex
-        # Pattern for replacement: \%Y -> regex
-        pattern_str = pattern_str.replace(escaped_code, regex)
-    
-    # Allow whitespace flexibility
-    pattern_str = pattern_str.replace(r'\ ', r'\s+')
-    
-    return re.compile(f"^{pattern_str}$")
+    parts = []
+    directives = []
+    i = 0
+    length = len(fmt)
+    
+    while i < length:
+        code = fmt[i:i + 2]
+        regex = _FORMAT_CODE_PATTERNS.get(code)
+        if regex is not None:
+            parts.append(regex)
+            directives.append(code[1])
+            i += 2
+        elif code == '%%':
+            parts.append('%')
+            i += 2
+        else:
+            char = fmt[i]
+            # Allow whitespace flexibility
+            parts.append(r'\s+' if char == ' ' else re.escape(char))
+            i += 1
+    
+    return re.compile(f"^{''.join(parts)}$"), tuple(directives)
+
+
+# Hand-written parsers for the most common strptime formats. Each accepts
+# only the zero-padded, single-space shape of its format and returns
+# (year, month, day, hour, minute, second), or None to defer to the
+# general regex path (which also handles unpadded fields and extra spaces).
+
+_DEVANAGARI_DIGITS = frozenset('०१२३४५६७८९')
+
+_FastFields = Optional[Tuple[int, int, int, int, int, int]]
+
+
+def _fast_date(text: str) -> _FastFields:
+    """Parse '%Y-%m-%d', e.g. 2080-10-24."""
+    if len(text) == 10 and text[4] == '-' and text[7] == '-':
+        year, month, day = text[:4], text[5:7], text[8:]
+        if year.isdecimal() and month.isdecimal() and day.isdecimal():
+            return int(year), int(month), int(day), 0, 0, 0
+    return None
+
 
+def _fast_date_nepali(text: str) -> _FastFields:
+    """Parse '%K-%n-%D', e.g. २०८०-१०-२४."""
+    if len(text) == 10 and text[4] == '-' and text[7] == '-':
+        year, month, day = text[:4], text[5:7], text[8:]
+        if _DEVANAGARI_DIGITS.issuperset(year + month + day):
+            # int() reads Devanagari digits directly
+            return int(year), int(month), int(day), 0, 0, 0
+    return None
 
-def parse_bs_datetime(date_string: str, fmt: str) -> 'BSDateTime':
+
+def _fast_datetime_minutes(text: str) -> _FastFields:
+    """Parse '%Y-%m-%d %H:%M', e.g. 2080-10-24 14:30."""
+    if len(text) == 16 and text[10] == ' ' and text[13] == ':':
+        fields = _fast_date(text[:10])
+        hour, minute = text[11:13], text[14:]
+        if fields is not None and hour.isdecimal() and minute.isdecimal():
+            return fields[0], fields[1], fields[2], int(hour), int(minute), 0
+    return None
+
+
+def _fast_datetime_seconds(text: str) -> _FastFields:
+    """Parse '%Y-%m-%d %H:%M:%S', e.g. 2080-10-24 14:30:00."""
+    if len(text) == 19 and text[16] == ':':
+        fields = _fast_datetime_minutes(text[:16])
+        second = text[17:]
+        if fields is not None and second.isdecimal():
+            return fields[:5] + (int(second),)
+    return None
+
+
+def _fast_datetime_ampm(text: str) -> _FastFields:
+    """Parse '%Y-%m-%d %I:%M %p', e.g. 2080-10-24 02:30 PM."""
+    if len(text) == 19 and text[16] == ' ':
+        fields = _fast_datetime_minutes(text[:16])
+        ampm = text[17:]
+        if fields is not None and ampm in _MERIDIEMS:
+            hour = _to_24_hour(fields[3], ampm)
+            return fields[0], fields[1], fields[2], hour, fields[4], 0
+    return None
+
+
+# Directive letters that supply each required date component
+_YEAR_DIRECTIVES = frozenset('YyKk')
+_MONTH_DIRECTIVES = frozenset('mn')
+_DAY_DIRECTIVES = frozenset('dD')
+
+
+_FAST_FORMATS = {
+    '%Y-%m-%d': _fast_date,
+    '%K-%n-%D': _fast_date_nepali,
+    '%Y-%m-%d %H:%M': _fast_datetime_minutes,
+    '%Y-%m-%d %H:%M:%S': _fast_datetime_seconds,
+    '%Y-%m-%d %I:%M %p': _fast_datetime_ampm,
+}
+
+
+def parse_bs_datetime(date_string: str, fmt: str) -> BSDateTime:
     """
     Parse a date string according to a format string.
     
@@ -328,25 +395,31 @@ def parse_bs_datetime(date_string: str, fmt: str) -> 'BSDateTime':
         BSDateTime object.
     
     Raises:
-        ValueError: If parsing fails.
+        ValueError: If fmt lacks a year, month or day, or parsing fails.
     """
-    from nepalify.dates.bs_date import BSDate
-    from nepalify.dates.bs_datetime import BSDateTime
-    from nepalify.text.constants import TIME_PERIODS_NEPALI
-
+    # Common formats in their canonical shape skip the regex entirely
+    fast_parser = _FAST_FORMATS.get(fmt)
+    if fast_parser is not None:
+        fields = fast_parser(date_string)
+        if fields is not None:
+            return BSDateTime(*fields)
     
     # Compile pattern
-    pattern = _compile_format(fmt)
+    pattern, directives = _compile_format(fmt)
+    if (
+        _YEAR_DIRECTIVES.isdisjoint(directives)
+        or _MONTH_DIRECTIVES.isdisjoint(directives)
+        or _DAY_DIRECTIVES.isdisjoint(directives)
+    ):
+        # BSDateTime has no default date, so a partial format can never parse
+        raise ValueError(f"format '{fmt}' must include a year, month and day")
+    
     match = pattern.match(date_string)
     
     if not match:
         raise ValueError(f"time data '{date_string}' does not match format '{fmt}'")
     
-    groups = match.groupdict()
-    
-    # Extract date components (default to today/now if missing?)
-    # Usually strftime defaults to 1900-01-01. BS might default to something else?
-    # BSDateTime defaults: year, month, day required. Time defaults to 0.
+    groups = dict(zip(directives, match.groups()))
     
     # Parse Year
     year = 0
@@ -375,17 +448,6 @@ def parse_bs_datetime(date_string: str, fmt: str) -> 'BSDateTime':
     elif 'D' in groups:
         day = int(_normalize_nepali_digits(groups['D']))
     
-    # Validate required date components
-    if year == 0 or month == 0 or day == 0:
-        # If any essential component is missing, we can't create a valid date
-        # Unless we default them. Python's strptime defaults to 1900-01-01.
-        # But for BS, maybe 1970? Or error?
-        # BSDateTime constructor requires year, month, day.
-        # Let's enforce them for now or default to 1901-01-01 if completely missing?
-        # Better to raise error if missing.
-        # But typical strptime allows partial parsing if defaults exist.
-        pass
-    
     # Parse Time
     hour = 0
     if 'H' in groups:
@@ -419,11 +481,7 @@ def parse_bs_datetime(date_string: str, fmt: str) -> 'BSDateTime':
     nepali_period = groups.get('P')
     
     if ampm:
-        ampm = ampm.upper()
-        if ampm == 'PM' and hour != 12:
-            hour += 12
-        elif ampm == 'AM' and hour == 12:
-            hour = 0
+        hour = _to_24_hour(hour, ampm)
     elif nepali_period:
         # Map Nepali period to 24h?
         # Roughly: Morning (4-11), Afternoon (12-15), Evening (16-19), Night (20-3)
@@ -442,6 +500,7 @@ def parse_bs_datetime(date_string: str, fmt: str) -> 'BSDateTime':
 
 __all__ = [
     "parse",
+    "parse_many",
     "parse_date",
     "parse_datetime",
     "parse_bs_datetime",
@@ -18,11 +18,12 @@ Example:
 """
 
 import datetime
-from typing import Optional, Union
+from typing import Optional
 
 # Constants
 NEPAL_TIMEZONE = "Asia/Kathmandu"
 NPT_OFFSET = datetime.timedelta(hours=5, minutes=45)
+_ZERO = datetime.timedelta(0)
 
 
 class NepaliTimeZone(datetime.tzinfo):
@@ -81,7 +82,7 @@ class NepaliTimeZone(datetime.tzinfo):
         Returns:
             timedelta: Zero (no DST adjustment).
         """
-        return datetime.timedelta(0)
+        return _ZERO
     
     def tzname(self, dt: Optional[datetime.datetime]) -> str:
         """
@@ -184,7 +185,7 @@ def nepali_now() -> datetime.datetime:
         >>> print(npt.tzname())
         Asia/Kathmandu
     """
-    return datetime.datetime.now(NepaliTimeZone())
+    return datetime.datetime.now(NPT)
 
 
 def to_nepali_timezone(dt: datetime.datetime) -> datetime.datetime:
@@ -217,12 +218,8 @@ def to_nepali_timezone(dt: datetime.datetime) -> datetime.datetime:
     if not isinstance(dt, datetime.datetime):
         raise TypeError(f"Expected datetime.datetime, got {type(dt).__name__}")
     
-    # Handle naive datetime - assume local timezone
-    if dt.tzinfo is None:
-        local_tz = get_local_timezone()
-        dt = dt.replace(tzinfo=local_tz)
-    
-    return dt.astimezone(NepaliTimeZone())
+    # astimezone() treats naive datetimes as local time itself
+    return dt.astimezone(NPT)
 
 
 def to_utc_timezone(dt: datetime.datetime) -> datetime.datetime:
@@ -255,11 +252,7 @@ def to_utc_timezone(dt: datetime.datetime) -> datetime.datetime:
     if not isinstance(dt, datetime.datetime):
         raise TypeError(f"Expected datetime.datetime, got {type(dt).__name__}")
     
-    # Handle naive datetime - assume local timezone
-    if dt.tzinfo is None:
-        local_tz = get_local_timezone()
-        dt = dt.replace(tzinfo=local_tz)
-    
+    # astimezone() treats naive datetimes as local time itself
     return dt.astimezone(datetime.timezone.utc)
 
 
@@ -288,7 +281,7 @@ def from_utc(
         2024-02-07 11:00:00+05:45
     """
     if target_tz is None:
-        target_tz = NepaliTimeZone()
+        target_tz = NPT
     
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=datetime.timezone.utc)
@@ -9,14 +9,24 @@ Functions for:
 """
 
 from nepalify.numbers.devanagari import to_devanagari, from_devanagari
-from nepalify.numbers.formatting import format_number, to_words_nepali
-from nepalify.numbers.ordinals import to_nepali_ordinal, from_nepali_ordinal
+from nepalify.numbers.formatting import (
+    format_number,
+    format_numbers,
+    to_words_nepali,
+)
+from nepalify.numbers.ordinals import (
+    to_nepali_ordinal,
+    from_nepali_ordinal,
+    from_nepali_ordinal_fast,
+)
 
 __all__ = [
     "to_devanagari",
     "from_devanagari",
     "format_number",
+    "format_numbers",
     "to_words_nepali",
     "to_nepali_ordinal",
     "from_nepali_ordinal",
+    "from_nepali_ordinal_fast",
 ]
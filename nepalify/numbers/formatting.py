@@ -6,8 +6,34 @@ Supports:
 - Number to Nepali words conversion
 """
 
-from typing import Union
-from nepalify.numbers.devanagari import to_devanagari
+from functools import lru_cache
+from typing import Iterable, List, Tuple, Union
+from nepalify.numbers.devanagari import _EN_TO_NP
+
+
+def _group_indian(digits: str, delimiter: str) -> str:
+    """
+    Insert delimiters into a digit string using 3-2-2 grouping.
+    
+    Groups are cut with a single left-to-right slicing pass: the leading
+    group takes the odd digit (if any) of everything before the last three.
+    """
+    if len(digits) <= 3:
+        return digits
+    
+    head = digits[:-3]
+    start = len(head) % 2
+    groups: List[str] = [head[:start]] if start else []
+    groups.extend([head[i:i + 2] for i in range(start, len(head), 2)])
+    groups.append(digits[-3:])
+    return delimiter.join(groups)
+
+
+def _format_int(number: int, delimiter: str) -> str:
+    """Group a plain int directly; it has no commas or decimals to handle."""
+    if number < 0:
+        return '-' + _group_indian(str(-number), delimiter)
+    return _group_indian(str(number), delimiter)
 
 
 def format_number(
@@ -41,8 +67,17 @@ def format_number(
         format_number("2,553,871")  # Western format → Nepali
         '25,53,871'
     """
-    # Convert to string and strip existing commas
-    num_str = str(number).replace(',', '')
+    if type(number) is int:
+        formatted = _format_int(number, delimiter)
+        if use_devanagari:
+            formatted = formatted.translate(_EN_TO_NP)
+        return formatted
+    
+    # Convert to string; only strings can carry existing commas
+    if isinstance(number, str):
+        num_str = number.replace(',', '')
+    else:
+        num_str = str(number)
     
     # Handle negative numbers
     is_negative = num_str.startswith('-')
@@ -50,33 +85,14 @@ def format_number(
         num_str = num_str[1:]
     
     # Separate integer and decimal parts
-    if '.' in num_str:
-        integer_part, decimal_part = num_str.split('.', 1)
-    else:
-        integer_part = num_str
-        decimal_part = None
+    integer_part, sep, decimal_part = num_str.partition('.')
+    has_decimal = bool(sep)
     
     # Apply Indian/Nepali grouping: first 3 digits from right, then 2 digits each
-    if len(integer_part) <= 3:
-        formatted = integer_part
-    else:
-        # Take last 3 digits
-        result = [integer_part[-3:]]
-        remaining = integer_part[:-3]
-        
-        # Group remaining digits in pairs of 2 from right to left
-        while len(remaining) > 2:
-            result.insert(0, remaining[-2:])
-            remaining = remaining[:-2]
-        
-        # Add any remaining digits (1 or 2)
-        if remaining:
-            result.insert(0, remaining)
-        
-        formatted = delimiter.join(result)
+    formatted = _group_indian(integer_part, delimiter)
     
     # Rejoin with decimal part if present
-    if decimal_part is not None:
+    if has_decimal:
         formatted = f"{formatted}.{decimal_part}"
     
     # Add negative sign back
@@ -85,13 +101,49 @@ def format_number(
     
     # Convert to Devanagari if requested
     if use_devanagari:
-        formatted = to_devanagari(formatted)
+        formatted = formatted.translate(_EN_TO_NP)
     
     return formatted
 
 
+def format_numbers(
+    numbers: Iterable[Union[int, float, str]],
+    use_devanagari: bool = False,
+    delimiter: str = ","
+) -> List[str]:
+    """
+    Format many numbers using the Indian/Nepali numbering system.
+    
+    Equivalent to calling format_number() on each item, but integers skip
+    the string clean-up and decimal handling and go straight to grouping.
+    
+    Args:
+        numbers: Iterable of numbers (int, float, or string).
+        use_devanagari: If True, convert digits to Devanagari numerals.
+        delimiter: Character to use as thousands separator (default: comma).
+    
+    Returns:
+        List of formatted number strings, in input order.
+    
+    Examples:
+        format_numbers([1234, 1234567])→
+        ['1,234', '12,34,567']
+    """
+    results: List[str] = []
+    append = results.append
+    for number in numbers:
+        if type(number) is int:
+            append(_format_int(number, delimiter))
+        else:
+            append(format_number(number, delimiter=delimiter))
+    
+    if use_devanagari:
+        return [result.translate(_EN_TO_NP) for result in results]
+    return results
+
+
 # Nepali number words
-_ONES = [
+_ONES: Tuple[str, ...] = (
     '', 'एक', 'दुई', 'तीन', 'चार', 'पाँच', 'छ', 'सात', 'आठ', 'नौ',
     'दश', 'एघार', 'बाह्र', 'तेह्र', 'चौध', 'पन्ध्र', 'सोह्र', 'सत्र', 'अठार', 'उन्नाइस',
     'बीस', 'एक्काइस', 'बाइस', 'तेइस', 'चौबीस', 'पच्चीस', 'छब्बीस', 'सत्ताइस', 'अठ्ठाइस', 'उनन्तीस',
@@ -102,7 +154,7 @@ _ONES = [
     'सत्तरी', 'एकहत्तर', 'बहत्तर', 'त्रिहत्तर', 'चौहत्तर', 'पचहत्तर', 'छयहत्तर', 'सतहत्तर', 'अठहत्तर', 'उनासी',
     'असी', 'एकासी', 'बयासी', 'त्रियासी', 'चौरासी', 'पचासी', 'छयासी', 'सतासी', 'अठासी', 'उनान्नब्बे',
     'नब्बे', 'एकानब्बे', 'बयानब्बे', 'त्रियानब्बे', 'चौरानब्बे', 'पंचानब्बे', 'छयानब्बे', 'सन्तानब्बे', 'अन्ठानब्बे', 'उनान्सय'
-]
+)
 
 _HUNDRED = 'सय'
 _THOUSAND = 'हजार'
@@ -112,34 +164,18 @@ _ARAB = 'अर्ब'
 _KHARAB = 'खर्ब'
 
 
-def _convert_two_digits(n: int) -> str:
-    """Convert a number 0-99 to Nepali words."""
-    if n < 100:
-        return _ONES[n]
-    return ''
-
-
-def _convert_three_digits(n: int) -> str:
-    """Convert a number 0-999 to Nepali words."""
-    if n == 0:
-        return ''
-    
-    result = []
-    
-    # Hundreds place
-    if n >= 100:
-        hundreds = n // 100
-        result.append(_ONES[hundreds])
-        result.append(_HUNDRED)
-        n %= 100
-    
-    # Remaining two digits
-    if n > 0:
-        result.append(_ONES[n])
-    
-    return ' '.join(result)
+# Scale words from largest to smallest; each count is always below 100
+_SCALES: Tuple[Tuple[int, str], ...] = (
+    (10**11, _KHARAB),
+    (10**9, _ARAB),
+    (10**7, _CRORE),
+    (10**5, _LAKH),
+    (10**3, _THOUSAND),
+    (100, _HUNDRED),
+)
 
 
+@lru_cache(maxsize=4096, typed=True)
 def to_words_nepali(number: int) -> str:
     """
     Convert a number to Nepali words.
@@ -172,10 +208,12 @@ def to_words_nepali(number: int) -> str:
         'एक करोड'
     
     Raises:
-        ValueError: If number is negative.
+        ValueError: If number is negative or 10^13 or larger.
     """
     if number < 0:
         raise ValueError("Negative numbers are not supported")
+    if number >= 10**13:
+        raise ValueError("Numbers of 100 kharab (10^13) or more are not supported")
     
     if number == 0:
         return 'शुन्य'
@@ -183,45 +221,16 @@ def to_words_nepali(number: int) -> str:
     if number < 100:
         return _ONES[number]
     
-    parts = []
-    
-    # Kharab (10^11)
-    if number >= 10**11:
-        kharab = number // 10**11
-        parts.append(_convert_two_digits(kharab))
-        parts.append(_KHARAB)
-        number %= 10**11
-    
-    # Arab (10^9)
-    if number >= 10**9:
-        arab = number // 10**9
-        parts.append(_convert_two_digits(arab))
-        parts.append(_ARAB)
-        number %= 10**9
-    
-    # Crore (10^7)
-    if number >= 10**7:
-        crore = number // 10**7
-        parts.append(_convert_two_digits(crore))
-        parts.append(_CRORE)
-        number %= 10**7
-    
-    # Lakh (10^5)
-    if number >= 10**5:
-        lakh = number // 10**5
-        parts.append(_convert_two_digits(lakh))
-        parts.append(_LAKH)
-        number %= 10**5
-    
-    # Thousand (10^3)
-    if number >= 10**3:
-        thousand = number // 10**3
-        parts.append(_convert_two_digits(thousand))
-        parts.append(_THOUSAND)
-        number %= 10**3
-    
-    # Remaining (0-999)
-    if number > 0:
-        parts.append(_convert_three_digits(number))
+    parts: List[str] = []
+    
+    # Peel off each scale (kharab down to hundred), then the 0-99 remainder
+    for scale, word in _SCALES:
+        if number >= scale:
+            count, number = divmod(number, scale)
+            parts.append(_ONES[count])
+            parts.append(word)
+    
+    if number:
+        parts.append(_ONES[number])
     
     return ' '.join(parts)
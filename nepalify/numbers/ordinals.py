@@ -4,6 +4,8 @@ Nepali ordinal number conversion utilities.
 Convert between integers, English ordinal text, and Nepali ordinal strings.
 """
 
+import re
+from functools import lru_cache
 from typing import Union, Dict
 
 
@@ -199,9 +201,21 @@ ORDINALS_ENGLISH: Dict[str, int] = {
 # Case-insensitive lookup
 _ENGLISH_LOWER: Dict[str, int] = {k.lower(): v for k, v in ORDINALS_ENGLISH.items()}
 
+# Abbreviated forms not listed above (e.g. "33rd", "45th"), matched on
+# lowercased input
+_ABBREV_RE = re.compile(r"(\d+)(st|nd|rd|th)$")
+
+
+def _english_suffix(n: int) -> str:
+    """Return the English ordinal suffix for n ("st", "nd", "rd" or "th")."""
+    if n % 100 in (11, 12, 13):
+        return "th"
+    return ("th", "st", "nd", "rd")[n % 10] if n % 10 < 4 else "th"
+
 
 # ─── Conversion Functions ──────────────────────────────────────────────────────
 
+@lru_cache(maxsize=512, typed=True)
 def to_nepali_ordinal(value: Union[int, str]) -> str:
     """
     Convert a number or English ordinal text to a Nepali ordinal string.
@@ -243,6 +257,7 @@ def to_nepali_ordinal(value: Union[int, str]) -> str:
         )
 
 
+@lru_cache(maxsize=512)
 def from_nepali_ordinal(text: str) -> int:
     """
     Convert a Nepali ordinal string to its integer value.
@@ -264,11 +279,33 @@ def from_nepali_ordinal(text: str) -> int:
     Raises:
         ValueError: If the text is not a recognized Nepali ordinal.
     """
-    text = text.strip()
-    result = _NEPALI_TO_INT.get(text)
-    if result is None:
-        raise ValueError(f"Unrecognized Nepali ordinal: '{text}'")
-    return result
+    return from_nepali_ordinal_fast(text.strip())
+
+
+def from_nepali_ordinal_fast(text: str) -> int:
+    """
+    Convert a pre-stripped Nepali ordinal string to its integer value.
+
+    Like from_nepali_ordinal(), but skips whitespace stripping. Use it for
+    trusted input such as strings produced by to_nepali_ordinal().
+
+    Args:
+        text: Nepali ordinal string without surrounding whitespace.
+
+    Returns:
+        Integer value of the ordinal.
+
+    Examples:
+        >>> from_nepali_ordinal_fast("पहिलो")
+        1
+
+    Raises:
+        ValueError: If the text is not a recognized Nepali ordinal.
+    """
+    try:
+        return _NEPALI_TO_INT[text]
+    except KeyError:
+        raise ValueError(f"Unrecognized Nepali ordinal: '{text}'") from None
 
 
 # ─── Internal Helpers ──────────────────────────────────────────────────────────
@@ -296,6 +333,14 @@ def _str_to_nepali_ordinal(text: str) -> str:
     if num is not None:
         return ORDINALS_NEPALI[num]
 
+    # Try any other abbreviated form
+    match = _ABBREV_RE.match(text)
+    if match is not None:
+        n = int(match.group(1))
+        # Only the suffix that fits the number, so "1th" and "3st" are rejected
+        if match.group(2) == _english_suffix(n):
+            return _int_to_nepali_ordinal(n)
+
     # Try parsing as a plain integer string
     try:
         n = int(text)
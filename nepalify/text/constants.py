@@ -4,10 +4,11 @@ Nepali language constants.
 BS Month Names, Day Names, and related constants.
 """
 
-from typing import List
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
 # BS Month Names - Formal/Colloquial (1-indexed: Baisakh=1, Chaitra=12)
-MONTHS_NEPALI: List[str] = [
+MONTHS_NEPALI: Tuple[str, ...] = (
     "बैशाख",    # 1 - Baisakh (Apr-May)
     "जेठ",      # 2 - Jestha (May-Jun)
     "असार",     # 3 - Ashadh (Jun-Jul)
@@ -20,10 +21,10 @@ MONTHS_NEPALI: List[str] = [
     "माघ",      # 10 - Magh (Jan-Feb)
     "फागुन",    # 11 - Falgun (Feb-Mar)
     "चैत",      # 12 - Chaitra (Mar-Apr)
-]
+)
 
 # BS Month Names - Sanskrit/Traditional
-MONTHS_NEPALI_SANSKRIT: List[str] = [
+MONTHS_NEPALI_SANSKRIT: Tuple[str, ...] = (
     "वैशाख",    # 1 - Vaisakha (Apr-May)
     "ज्येष्ठ",   # 2 - Jyeshtha (May-Jun)
     "आषाढ",     # 3 - Asadha (Jun-Jul)
@@ -36,9 +37,9 @@ MONTHS_NEPALI_SANSKRIT: List[str] = [
     "माघ",      # 10 - Magha (Jan-Feb)
     "फाल्गुन",   # 11 - Phalguna (Feb-Mar)
     "चैत्र",     # 12 - Chaitra (Mar-Apr)
-]
+)
 
-MONTHS_ENGLISH: List[str] = [
+MONTHS_ENGLISH: Tuple[str, ...] = (
     "Baishakh",
     "Jestha",
     "Asar",
@@ -51,9 +52,9 @@ MONTHS_ENGLISH: List[str] = [
     "Magh",
     "Falgun",
     "Chaitra",
-]
+)
 
-MONTHS_ENGLISH_SHORT: List[str] = [
+MONTHS_ENGLISH_SHORT: Tuple[str, ...] = (
     "Bai",
     "Jes",
     "Asa",
@@ -66,10 +67,10 @@ MONTHS_ENGLISH_SHORT: List[str] = [
     "Mag",
     "Fal",
     "Cha",
-]
+)
 
 # Day Names (0-indexed: Sunday=0, Saturday=6)
-DAYS_NEPALI: List[str] = [
+DAYS_NEPALI: Tuple[str, ...] = (
     "आइतबार",    # 0 - Sunday
     "सोमबार",    # 1 - Monday
     "मंगलबार",   # 2 - Tuesday
@@ -77,9 +78,9 @@ DAYS_NEPALI: List[str] = [
     "बिहिबार",   # 4 - Thursday
     "शुक्रबार",   # 5 - Friday
     "शनिबार",    # 6 - Saturday
-]
+)
 
-DAYS_NEPALI_SHORT: List[str] = [
+DAYS_NEPALI_SHORT: Tuple[str, ...] = (
     "आइत",
     "सोम",
     "मंगल",
@@ -87,9 +88,9 @@ DAYS_NEPALI_SHORT: List[str] = [
     "बिहि",
     "शुक्र",
     "शनि",
-]
+)
 
-DAYS_ENGLISH: List[str] = [
+DAYS_ENGLISH: Tuple[str, ...] = (
     "Sunday",
     "Monday",
     "Tuesday",
@@ -97,9 +98,9 @@ DAYS_ENGLISH: List[str] = [
     "Thursday",
     "Friday",
     "Saturday",
-]
+)
 
-DAYS_ENGLISH_SHORT: List[str] = [
+DAYS_ENGLISH_SHORT: Tuple[str, ...] = (
     "Sun",
     "Mon",
     "Tue",
@@ -107,10 +108,10 @@ DAYS_ENGLISH_SHORT: List[str] = [
     "Thu",
     "Fri",
     "Sat",
-]
+)
 
 # Gregorian month names in Nepali
-GREGORIAN_MONTHS_NEPALI: List[str] = [
+GREGORIAN_MONTHS_NEPALI: Tuple[str, ...] = (
     "जनवरी",
     "फेब्रुअरी",
     "मार्च",
@@ -123,9 +124,9 @@ GREGORIAN_MONTHS_NEPALI: List[str] = [
     "अक्टोबर",
     "नोभेम्बर",
     "डिसेम्बर",
-]
+)
 
-GREGORIAN_MONTHS_ENGLISH: List[str] = [
+GREGORIAN_MONTHS_ENGLISH: Tuple[str, ...] = (
     "January",
     "February",
     "March",
@@ -138,10 +139,10 @@ GREGORIAN_MONTHS_ENGLISH: List[str] = [
     "October",
     "November",
     "December",
-]
+)
 
 # Common Nepali time-related words
-TIME_WORDS_NEPALI = {
+TIME_WORDS_NEPALI: Mapping[str, str] = MappingProxyType({
     "today": "आज",
     "tomorrow": "भोलि",
     "yesterday": "हिजो",
@@ -152,13 +153,13 @@ TIME_WORDS_NEPALI = {
     "hour": "घण्टा",
     "minute": "मिनेट",
     "second": "सेकेन्ड",
-}
+})
 
 # Number words (for display/formatting)
-NUMBER_WORDS_NEPALI = {
+NUMBER_WORDS_NEPALI: Mapping[int, str] = MappingProxyType({
     0: "शुन्य",
     1: "एक",
-    2: "दुई", 
+    2: "दुई",
     3: "तीन",
     4: "चार",
     5: "पाँच",
@@ -167,14 +168,30 @@ NUMBER_WORDS_NEPALI = {
     8: "आठ",
     9: "नौ",
     10: "दश",
-}
+})
 
 
 # Nepali Time Periods
-TIME_PERIODS_NEPALI = {
+TIME_PERIODS_NEPALI: Mapping[str, str] = MappingProxyType({
     'morning': 'बिहान',      # 4:00 - 11:59
     'afternoon': 'दिउँसो',   # 12:00 - 15:59
     'evening': 'बेलुका',     # 16:00 - 19:59
     'night': 'राति',         # 20:00 - 3:59
-}
+})
 
+
+def _build_name_to_month() -> Mapping[str, int]:
+    """Map every lowercased month name and abbreviation to its number."""
+    names = {}
+    for month, name in enumerate(MONTHS_ENGLISH, 1):
+        names[name.lower()] = month
+        names[name[:3].lower()] = month
+    for table in (MONTHS_ENGLISH_SHORT, MONTHS_NEPALI, MONTHS_NEPALI_SANSKRIT):
+        for month, name in enumerate(table, 1):
+            names[name.lower()] = month
+    return MappingProxyType(names)
+
+
+# Month name lookup (English, abbreviations, formal and Sanskrit Nepali),
+# keyed by lowercased name; lowercasing leaves Devanagari unchanged
+_NAME_TO_MONTH: Mapping[str, int] = _build_name_to_month()
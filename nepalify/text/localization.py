@@ -5,19 +5,56 @@ Convert English text elements to Nepali Devanagari.
 """
 
 import re
-from typing import Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
-from nepalify.numbers.devanagari import to_devanagari
+from nepalify.numbers.devanagari import _EN_TO_NP
 from nepalify.text.constants import (
     MONTHS_NEPALI,
+    MONTHS_NEPALI_SANSKRIT,
     MONTHS_ENGLISH,
+    MONTHS_ENGLISH_SHORT,
     DAYS_NEPALI,
+    DAYS_NEPALI_SHORT,
     DAYS_ENGLISH,
+    DAYS_ENGLISH_SHORT,
     GREGORIAN_MONTHS_NEPALI,
     GREGORIAN_MONTHS_ENGLISH,
 )
 
 
+def _numbered(names: Tuple[str, ...], first: int) -> Dict[int, str]:
+    """Map each name to its number, starting at first."""
+    return dict(enumerate(names, first))
+
+
+# Name tables keyed by (nepali, abbreviated, style) and (nepali, abbreviated).
+# Nepali month names have no abbreviated form, and English names have no
+# style variant, so those options map to the same table. Each table maps
+# only the valid numbers, so the lookup itself rejects anything else.
+_MONTHS_NEPALI = _numbered(MONTHS_NEPALI, 1)
+_MONTHS_NEPALI_SANSKRIT = _numbered(MONTHS_NEPALI_SANSKRIT, 1)
+_MONTHS_ENGLISH = _numbered(MONTHS_ENGLISH, 1)
+_MONTHS_ENGLISH_SHORT = _numbered(MONTHS_ENGLISH_SHORT, 1)
+
+_MONTH_TABLE = {
+    (True, False, 'formal'): _MONTHS_NEPALI,
+    (True, True, 'formal'): _MONTHS_NEPALI,
+    (True, False, 'sanskrit'): _MONTHS_NEPALI_SANSKRIT,
+    (True, True, 'sanskrit'): _MONTHS_NEPALI_SANSKRIT,
+    (False, False, 'formal'): _MONTHS_ENGLISH,
+    (False, True, 'formal'): _MONTHS_ENGLISH_SHORT,
+    (False, False, 'sanskrit'): _MONTHS_ENGLISH,
+    (False, True, 'sanskrit'): _MONTHS_ENGLISH_SHORT,
+}
+
+_DAY_TABLE = {
+    (True, False): _numbered(DAYS_NEPALI, 0),
+    (True, True): _numbered(DAYS_NEPALI_SHORT, 0),
+    (False, False): _numbered(DAYS_ENGLISH, 0),
+    (False, True): _numbered(DAYS_ENGLISH_SHORT, 0),
+}
+
+
 def get_month_name(
     month: int,
     nepali: bool = True,
@@ -53,20 +90,14 @@ def get_month_name(
     Raises:
         ValueError: If month is not in range 1-12.
     """
-    if not 1 <= month <= 12:
-        raise ValueError(f"Month must be 1-12, got {month}")
-    
-    if nepali:
-        if style == 'sanskrit':
-            from nepalify.text.constants import MONTHS_NEPALI_SANSKRIT
-            return MONTHS_NEPALI_SANSKRIT[month - 1]
-        else:  # 'formal' (default)
-            return MONTHS_NEPALI[month - 1]
-    elif abbreviated:
-        from nepalify.text.constants import MONTHS_ENGLISH_SHORT
-        return MONTHS_ENGLISH_SHORT[month - 1]
-    else:
-        return MONTHS_ENGLISH[month - 1]
+    names = _MONTH_TABLE.get((bool(nepali), bool(abbreviated), style))
+    if names is None:
+        # Unknown style: fall back to 'formal'
+        names = _MONTH_TABLE[(bool(nepali), bool(abbreviated), 'formal')]
+    try:
+        return names[month]
+    except KeyError:
+        raise ValueError(f"Month must be 1-12, got {month}") from None
 
 
 def get_day_name(
@@ -96,19 +127,10 @@ def get_day_name(
     Raises:
         ValueError: If weekday is not in range 0-6.
     """
-    if not 0 <= weekday <= 6:
-        raise ValueError(f"Weekday must be 0-6, got {weekday}")
-    
-    if nepali:
-        if abbreviated:
-            from nepalify.text.constants import DAYS_NEPALI_SHORT
-            return DAYS_NEPALI_SHORT[weekday]
-        return DAYS_NEPALI[weekday]
-    else:
-        if abbreviated:
-            from nepalify.text.constants import DAYS_ENGLISH_SHORT
-            return DAYS_ENGLISH_SHORT[weekday]
-        return DAYS_ENGLISH[weekday]
+    try:
+        return _DAY_TABLE[(bool(nepali), bool(abbreviated))][weekday]
+    except KeyError:
+        raise ValueError(f"Weekday must be 0-6, got {weekday}") from None
 
 
 # Build lookup dictionaries for conversion
@@ -120,6 +142,79 @@ _GREGORIAN_MONTH_MAP = {
 }
 
 
+def _compile_word_pattern(words: Iterable[str]) -> "re.Pattern[str]":
+    """
+    Compile a case-sensitive whole-word alternation over lowercase keys.
+    
+    Alternatives are tried longest-first so that a name is never cut short
+    by a shorter name sharing its prefix.
+    """
+    ordered = sorted(words, key=len, reverse=True)
+    alternation = '|'.join(re.escape(word) for word in ordered)
+    return re.compile(rf'\b(?:{alternation})\b')
+
+
+def _build_word_tables() -> Tuple[
+    Optional[Tuple["re.Pattern[str]", Dict[str, str]]], ...
+]:
+    """
+    Build a (pattern, mapping) pair for every combination of word categories.
+    
+    The tuple is indexed by a bitmask of enabled categories: 1 for day
+    names, 2 for BS months, 4 for Gregorian months. Index 0 (nothing to
+    replace) holds None.
+    """
+    categories = (_DAY_MAP, _MONTH_MAP, _GREGORIAN_MONTH_MAP)
+    tables: List[Optional[Tuple["re.Pattern[str]", Dict[str, str]]]] = [None]
+    for mask in range(1, 1 << len(categories)):
+        mapping: Dict[str, str] = {}
+        for bit, category in enumerate(categories):
+            if mask & (1 << bit):
+                mapping.update(category)
+        tables.append((_compile_word_pattern(mapping), mapping))
+    return tuple(tables)
+
+
+# Case-sensitive patterns, matched against the lowercased input
+_WORD_TABLES = _build_word_tables()
+
+
+def _replace_words(
+    text: str, pattern: "re.Pattern[str]", mapping: Dict[str, str]
+) -> str:
+    """
+    Replace whole-word matches of lowercase keys in text, ignoring case.
+    
+    The input is lowercased once and searched with a case-sensitive
+    pattern; replacements are spliced into the original string using the
+    match spans, so surrounding text keeps its case.
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Lowercasing changed the string length (e.g. 'İ'), so the spans
+        # would not line up with the original text.
+        return re.sub(
+            pattern.pattern,
+            # Case-fold variants (e.g. 'ſ') match but have no key: keep them
+            lambda m: mapping.get(m.group().lower(), m.group()),
+            text,
+            flags=re.IGNORECASE,
+        )
+    
+    pieces = []
+    last = 0
+    for match in pattern.finditer(lowered):
+        start, end = match.span()
+        pieces.append(text[last:start])
+        pieces.append(mapping[match.group()])
+        last = end
+    
+    if not pieces:
+        return text
+    pieces.append(text[last:])
+    return ''.join(pieces)
+
+
 def convert_to_nepali(
     text: Union[str, int, float],
     convert_digits: bool = True,
@@ -156,23 +251,23 @@ def convert_to_nepali(
     """
     result = str(text)
     
-    # Replace day names (case-insensitive, whole words only)
-    if convert_days:
-        for eng, nep in _DAY_MAP.items():
-            result = re.sub(rf'\b{eng}\b', nep, result, flags=re.IGNORECASE)
-    
-    # Replace BS month names
-    if convert_bs_months:
-        for eng, nep in _MONTH_MAP.items():
-            result = re.sub(rf'\b{eng}\b', nep, result, flags=re.IGNORECASE)
+    # Numbers carry no words to replace: translate the digits in one pass
+    if type(text) is int or type(text) is float:
+        return result.translate(_EN_TO_NP) if convert_digits else result
     
-    # Replace Gregorian month names
-    if convert_gregorian_months:
-        for eng, nep in _GREGORIAN_MONTH_MAP.items():
-            result = re.sub(rf'\b{eng}\b', nep, result, flags=re.IGNORECASE)
+    # Replace day, BS month and Gregorian month names in a single pass
+    # (case-insensitive, whole words only)
+    mask = (
+        (1 if convert_days else 0)
+        | (2 if convert_bs_months else 0)
+        | (4 if convert_gregorian_months else 0)
+    )
+    table = _WORD_TABLES[mask]
+    if table is not None:
+        result = _replace_words(result, *table)
     
     # Replace digits last (to not interfere with word replacements)
     if convert_digits:
-        result = to_devanagari(result)
+        result = result.translate(_EN_TO_NP)
     
     return result
@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import date, timedelta
-from nepalify.dates import BSDate, ad_to_bs, bs_to_ad
+from nepalify.dates import BSDate, ad_to_bs, bs_to_ad, ad_to_bs_batch, bs_to_ad_batch
 from nepalify.dates.converter import get_days_in_month, is_valid_bs_date
 
 
@@ -43,6 +43,53 @@ class TestConverter:
         back_to_bs = ad_to_bs(*ad)
         assert back_to_bs == original
     
+    def test_batch_matches_single(self):
+        """Batch conversion should agree with per-date conversion."""
+        start = date(2023, 12, 20)
+        ad_dates = [start + timedelta(days=i * 7) for i in range(60)]
+        bs = ad_to_bs_batch(
+            [d.year for d in ad_dates],
+            [d.month for d in ad_dates],
+            [d.day for d in ad_dates],
+        )
+        assert list(zip(*bs)) == [ad_to_bs(d.year, d.month, d.day) for d in ad_dates]
+        ad = bs_to_ad_batch(*bs)
+        assert list(zip(*ad)) == [(d.year, d.month, d.day) for d in ad_dates]
+    
+    def test_batch_invalid_date(self):
+        with pytest.raises(ValueError):
+            ad_to_bs_batch([2024, 1800], [1, 1], [1, 1])
+        with pytest.raises(ValueError):
+            bs_to_ad_batch([2080, 1899], [1, 1], [1, 1])
+    
+    def test_batch_length_mismatch(self):
+        with pytest.raises(ValueError, match="same length"):
+            ad_to_bs_batch([2024] * 3, [1], [1, 2])
+        with pytest.raises(ValueError, match="same length"):
+            bs_to_ad_batch([2080, 2080], [1, 1], iter([1]))
+    
+    def test_float_fields_rejected(self):
+        with pytest.raises(TypeError):
+            ad_to_bs(2024.0, 2, 6)
+        with pytest.raises(TypeError):
+            bs_to_ad(2080, 10, 23.0)
+        with pytest.raises(TypeError):
+            ad_to_bs_batch([2024], [2], [6.0])
+        with pytest.raises(TypeError):
+            bs_to_ad_batch([2080.0], [10], [23])
+    
+    def test_float_call_does_not_poison_cache(self):
+        ad_to_bs.cache_clear()
+        bs_to_ad.cache_clear()
+        with pytest.raises(TypeError):
+            ad_to_bs(2024.0, 2, 6)
+        with pytest.raises(TypeError):
+            bs_to_ad(2080, 10, 23.0)
+        result = ad_to_bs(2024, 2, 6)
+        assert all(type(field) is int for field in result)
+        assert all(type(field) is int for field in bs_to_ad(2080, 10, 23))
+        assert BSDate.from_ad(date(2024, 2, 6)).isoformat() == "%04d-%02d-%02d" % result
+    
     def test_invalid_bs_year(self):
         with pytest.raises(ValueError):
             bs_to_ad(1899, 1, 1)  # Before supported range (1901)
@@ -111,7 +158,25 @@ class TestBSDate:
         assert "१०" in formatted
         assert "२४" in formatted
     
-
+    def test_strftime_percent_escape(self):
+        d = BSDate(2080, 10, 24)
+        assert d.strftime("%%Y is %Y") == "%Y is 2080"
+    
+    def test_strftime_repeated_format(self):
+        d1 = BSDate(2080, 10, 24)
+        d2 = BSDate(2079, 1, 1)
+        assert d1.strftime("%Y/%m/%d") == "2080/10/24"
+        assert d2.strftime("%Y/%m/%d") == "2079/01/01"
+    
+    def test_strftime_same_date_alternating_formats(self):
+        d = BSDate(2080, 10, 24)
+        for _ in range(2):
+            assert d.strftime("%Y-%m-%d") == "2080-10-24"
+            assert d.strftime("%Y-%m-%d") == "2080-10-24"
+            assert d.strftime("%N") == "माघ"
+            assert d.strftime("%N", style='sanskrit') == "माघ"
+            assert d.strftime("%K") == "२०८०"
+        assert (d + 1).strftime("%Y-%m-%d") == "2080-10-25"
     
     def test_isoformat(self):
         d = BSDate(2080, 10, 24)
@@ -174,6 +239,54 @@ class TestBSDate:
         d = BSDate(2080, 10, 24)
         assert hash(d) == hash((2080, 10, 24))
     
+    def test_slots_no_instance_dict(self):
+        d = BSDate(2080, 10, 24)
+        assert not hasattr(d, "__dict__")
+        with pytest.raises(AttributeError):
+            d.extra = 1
+    
+    def test_fields_read_only(self):
+        d = BSDate(2080, 10, 24)
+        with pytest.raises(AttributeError):
+            d.year = 2081
+        assert BSDate.__match_args__ == ("year", "month", "day")
+    
+    def test_pickle_roundtrip(self):
+        import pickle
+        d = BSDate(2080, 10, 24)
+        d.toordinal()
+        restored = pickle.loads(pickle.dumps(d))
+        assert restored == d
+        assert restored.to_ad() == d.to_ad()
+    
+    def test_pickle_holds_only_fields(self):
+        import pickle
+        d = BSDate(2080, 10, 24)
+        hash(d)
+        d.toordinal()
+        d.strftime("%Y")
+        data = pickle.dumps(d)
+        assert b"2080" not in data
+        restored = pickle.loads(data)
+        assert restored._ordinal is None
+        assert restored._last_strftime is None
+    
+    def test_unpickle_field_only_state(self):
+        import pickle
+        # Written by a release whose __slots__ were just the fields
+        data = (
+            b'\x80\x02cnepalify.dates.bs_date\nBSDate\nq\x00)\x81q\x01N}q\x02('
+            b'X\x05\x00\x00\x00_yearq\x03M \x08X\x06\x00\x00\x00_monthq\x04K\n'
+            b'X\x04\x00\x00\x00_dayq\x05K\x18u\x86q\x06b.'
+        )
+        d = pickle.loads(data)
+        assert d == BSDate(2080, 10, 24)
+        assert hash(d) == hash(BSDate(2080, 10, 24))
+        assert d in {BSDate(2080, 10, 24)}
+        assert d.toordinal() == BSDate(2080, 10, 24).toordinal()
+        assert d.weekday() == BSDate(2080, 10, 24).weekday()
+        assert d.strftime("%Y-%m-%d") == "2080-10-24"
+    
     def test_replace(self):
         d = BSDate(2080, 10, 24)
         new_d = d.replace(day=15)
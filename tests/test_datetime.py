@@ -150,6 +150,13 @@ class TestBSDateTime:
         dt2 = BSDateTime(2080, 10, 24, 10, 0, 0)
         assert dt1 > dt2
     
+    def test_compare_across_timezones(self):
+        """Test comparison honours UTC offsets of different timezones."""
+        npt = BSDateTime(2080, 10, 24, 10, 0, 0, tzinfo=NPT)
+        utc = BSDateTime(2080, 10, 24, 5, 0, 0, tzinfo=py_timezone.utc)
+        assert npt < utc
+        assert utc > npt
+    
     def test_str(self):
         """Test string representation."""
         dt = BSDateTime(2080, 10, 24, 14, 30, 0)
@@ -161,6 +168,11 @@ class TestBSDateTime:
         dt = BSDateTime(2080, 10, 24, 14, 30, 0)
         assert "BSDateTime" in repr(dt)
     
+    def test_slots_no_instance_dict(self):
+        """Test instances carry no per-instance __dict__."""
+        dt = BSDateTime(2080, 10, 24, 14, 30, 0)
+        assert not hasattr(dt, "__dict__")
+    
     def test_isoformat(self):
         """Test ISO format output."""
         dt = BSDateTime(2080, 10, 24, 14, 30, 0)
@@ -205,6 +217,32 @@ class TestBSDateTime:
         assert tt.tm_min == 30
         assert tt.tm_sec == 0
 
+    def test_pickle_roundtrip(self):
+        """Test pickles hold only the fields and round-trip."""
+        import pickle
+        dt = BSDateTime(2080, 10, 24, 14, 30, 5, 123, tzinfo=NPT)
+        hash(dt)
+        restored = pickle.loads(pickle.dumps(dt))
+        assert restored == dt
+        assert hash(restored) == hash(dt)
+        assert restored.tzinfo is not None
+    
+    def test_unpickle_field_only_state(self):
+        """Test pickles holding only the slot fields still load."""
+        import pickle
+        # Written by a release whose __slots__ were just the fields
+        data = (
+            b'\x80\x02cnepalify.dates.bs_datetime\nBSDateTime\nq\x00)\x81q\x01N}q\x02('
+            b'X\x05\x00\x00\x00_yearq\x03M \x08X\x06\x00\x00\x00_monthq\x04K\n'
+            b'X\x04\x00\x00\x00_dayq\x05K\x18X\x05\x00\x00\x00_hourq\x06K\x0e'
+            b'X\x07\x00\x00\x00_minuteq\x07K\x1eX\x07\x00\x00\x00_secondq\x08K\x05'
+            b'X\x0c\x00\x00\x00_microsecondq\tK{X\x07\x00\x00\x00_tzinfoq\nNu\x86q\x0bb.'
+        )
+        dt = pickle.loads(data)
+        assert dt == BSDateTime(2080, 10, 24, 14, 30, 5, 123)
+        assert hash(dt) == hash(BSDateTime(2080, 10, 24, 14, 30, 5, 123))
+        assert dt.weekday() == BSDate(2080, 10, 24).weekday()
+
 
 class TestBSDateTimeStrftime:
 
@@ -295,6 +333,13 @@ class TestNepaliTimeZone:
         # 11:00 NPT - 5:45 = 5:15 UTC
         assert utc_dt.hour == 5
         assert utc_dt.minute == 15
+    
+    def test_naive_assumed_local(self):
+        """Test naive datetimes are treated as local time."""
+        naive = datetime(2024, 2, 7, 11, 0, 0)
+        assert to_nepali_timezone(naive) == naive.astimezone(NPT)
+        assert to_utc_timezone(naive) == naive.astimezone(py_timezone.utc)
+        assert to_nepali_timezone(naive).tzinfo is NPT
 
 
 class TestTimePeriods:
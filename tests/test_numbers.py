@@ -1,7 +1,13 @@
 """Tests for the numbers module."""
 
 import pytest
-from nepalify.numbers import to_devanagari, from_devanagari, format_number, to_words_nepali
+from nepalify.numbers import (
+    to_devanagari,
+    from_devanagari,
+    format_number,
+    format_numbers,
+    to_words_nepali,
+)
 
 
 class TestDevanagariConversion:
@@ -110,3 +116,22 @@ class TestToWordsNepali:
     def test_negative_raises(self):
         with pytest.raises(ValueError):
             to_words_nepali(-1)
+    
+    def test_too_large_raises(self):
+        assert to_words_nepali(10**13 - 1).startswith("उनान्सय खर्ब")
+        with pytest.raises(ValueError):
+            to_words_nepali(10**13)
+
+
+class TestFormatNumbers:
+    """Tests for batch number formatting."""
+    
+    def test_matches_format_number(self):
+        values = [0, 123, 1234, -1234567, 1234567.89, "2,553,871", 10**12]
+        assert format_numbers(values) == [format_number(v) for v in values]
+    
+    def test_devanagari(self):
+        assert format_numbers([1234567], use_devanagari=True) == ["१२,३४,५६७"]
+    
+    def test_empty(self):
+        assert format_numbers([]) == []
@@ -4,6 +4,7 @@ import pytest
 from nepalify.numbers.ordinals import (
     to_nepali_ordinal,
     from_nepali_ordinal,
+    from_nepali_ordinal_fast,
     ORDINALS_NEPALI,
 )
 
@@ -106,6 +107,17 @@ class TestToNepaliOrdinal:
     def test_abbreviated_21st(self):
         assert to_nepali_ordinal("21st") == "एक्काइसौं"
 
+    def test_abbreviated_unlisted(self):
+        assert to_nepali_ordinal("33rd") == "तेत्तीसौं"
+        assert to_nepali_ordinal("45TH") == "पैँतालीसौं"
+
+    def test_abbreviated_mismatched_suffix(self):
+        for text in ("1th", "3st", "22th", "33th", "11st", "12nd", "113rd", "45nd"):
+            with pytest.raises(ValueError):
+                to_nepali_ordinal(text)
+        assert to_nepali_ordinal("13th") == to_nepali_ordinal(13)
+        assert to_nepali_ordinal("92nd") == to_nepali_ordinal(92)
+
     # ── String number inputs ────────────────────────────────────────────
 
     def test_string_number(self):
@@ -177,6 +189,22 @@ class TestFromNepaliOrdinal:
             from_nepali_ordinal("")
 
 
+class TestFromNepaliOrdinalFast:
+    """Tests for from_nepali_ordinal_fast function."""
+
+    def test_all_mapped_values(self):
+        for num, nepali in ORDINALS_NEPALI.items():
+            assert from_nepali_ordinal_fast(nepali) == num
+
+    def test_whitespace_not_stripped(self):
+        with pytest.raises(ValueError):
+            from_nepali_ordinal_fast("  पहिलो  ")
+
+    def test_invalid_raises(self):
+        with pytest.raises(ValueError):
+            from_nepali_ordinal_fast("nonsense")
+
+
 class TestRoundTrip:
     """Test that to_nepali_ordinal and from_nepali_ordinal are inverses."""
 
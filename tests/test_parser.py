@@ -2,7 +2,7 @@
 
 import pytest
 from nepalify.dates import BSDate, BSDateTime
-from nepalify.dates import parse, parse_date, parse_datetime
+from nepalify.dates import parse, parse_many, parse_date, parse_datetime
 
 
 class TestParse:
@@ -32,6 +32,12 @@ class TestParse:
         assert result.month == 1
         assert result.day == 18
     
+    def test_other_unicode_digits(self):
+        """Test digits from other scripts parse like the strptime patterns."""
+        assert parse("٢٠٧٩-٠٢-١٥") == BSDate(2079, 2, 15)
+        assert parse("٢٠٧٩-٠٢-١٥ ١٥:٢٣") == BSDateTime(2079, 2, 15, 15, 23)
+        assert parse("٧٩-٠٢-١٥") == parse("79-02-15")
+    
     def test_named_month_english(self):
         """Test parsing named month format (English)."""
         result = parse("Jestha 15, 2079")
@@ -48,12 +54,22 @@ class TestParse:
         assert result.month == 10  # Magh is month 10
         assert result.day == 15
     
+    def test_named_month_day_first_nepali(self):
+        """Test parsing day-first format with a Nepali month name."""
+        result = parse("१५ माघ, २०८०")
+        assert result == BSDate(2080, 10, 15)
+    
     def test_named_month_short(self):
         """Test parsing abbreviated month name."""
         result = parse("Jes 15, 2079")
         assert isinstance(result, BSDate)
         assert result.month == 2  # Jestha
     
+    def test_named_month_short_constant(self):
+        """Test parsing the MONTHS_ENGLISH_SHORT abbreviation."""
+        assert parse("Ash 1, 2080").month == 6
+        assert parse("Aso 1, 2080").month == 6
+    
     def test_all_month_names(self):
         """Test parsing all English month names."""
         months = [
@@ -79,6 +95,11 @@ class TestParse:
         assert isinstance(result, BSDateTime)
         assert result.second == 45
     
+    def test_datetime_iso_t_separator(self):
+        """Test parsing the output of BSDateTime.isoformat()."""
+        dt = BSDateTime(2079, 2, 15, 15, 23, 45)
+        assert parse(dt.isoformat()) == dt
+    
     def test_datetime_am_pm(self):
         """Test parsing datetime with AM/PM."""
         result = parse("2079-02-15 5:23 AM")
@@ -103,6 +124,13 @@ class TestParse:
         with pytest.raises(ValueError):
             parse("invalid date format")
     
+    def test_case_fold_month_variant_raises(self):
+        """Test names matched only by case folding raise ValueError."""
+        with pytest.raises(ValueError):
+            parse("15 Jeſtha 2079")
+        with pytest.raises(ValueError):
+            parse("ſhrawan 1, 2080")
+    
     def test_invalid_date_raises(self):
         """Test that invalid date values raise ValueError."""
         with pytest.raises(ValueError):
@@ -114,6 +142,20 @@ class TestParse:
         assert result.year == 2079
 
 
+class TestParseMany:
+    """Tests for parse_many function."""
+    
+    def test_matches_parse(self):
+        """Test parse_many agrees with parse for mixed inputs."""
+        inputs = ["2079-02-15", " 2079/2/5 ", "२०७८-०१-१८", "Jestha 15, 2079", "2079-02-15 15:23"]
+        assert parse_many(inputs) == [parse(s) for s in inputs]
+    
+    def test_invalid_raises(self):
+        """Test parse_many raises on an unparseable entry."""
+        with pytest.raises(ValueError):
+            parse_many(["2079-02-15", "2080-13-01"])
+
+
 class TestParseDate:
     """Tests for parse_date function."""
     
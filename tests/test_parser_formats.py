@@ -1,9 +1,7 @@
 """Tests for enhanced parser with format codes."""
 
 import pytest
-from nepalify.dates import BSDateTime, BSDate
-from nepalify.dates.parser import parse_bs_datetime
-from nepalify.dates.timezone import NepaliTimeZone
+from nepalify.dates import BSDateTime
 
 class TestParserFormats:
     """Test parse_bs_datetime and BSDateTime.strptime with format codes."""
@@ -33,10 +31,11 @@ class TestParserFormats:
         assert dt.year == 2080
     
     def test_time_only_defaults(self):
-        """Test parsing time only (should error if date missing? or default?)"""
-        # Current implementation passes 'pass' if date missing -> defaults to 0 -> invalid date error likely
-        with pytest.raises(Exception): # ValueError or similar
-             BSDateTime.strptime("14:30", "%H:%M")
+        """Test parsing time only raises, as there is no default date"""
+        with pytest.raises(ValueError, match="year, month and day"):
+            BSDateTime.strptime("14:30", "%H:%M")
+        with pytest.raises(ValueError, match="year, month and day"):
+            BSDateTime.strptime("2080-10", "%Y-%m")
 
     def test_partial_year_k(self):
         """Test %k (short Nepali year)"""
@@ -53,3 +52,22 @@ class TestParserFormats:
         
         dt = BSDateTime.strptime("2080-10-24 02:30 AM", "%Y-%m-%d %I:%M %p")
         assert dt.hour == 2
+
+    def test_literal_percent(self):
+        """Test %% matches a literal percent sign"""
+        dt = BSDateTime.strptime("2080-10-24 %Y", "%Y-%m-%d %%Y")
+        assert dt.year == 2080
+        assert dt.day == 24
+
+    def test_common_format_unpadded(self):
+        """Test common formats still accept unpadded fields and extra spaces"""
+        assert BSDateTime.strptime("2080-1-5", "%Y-%m-%d") == BSDateTime(2080, 1, 5)
+        dt = BSDateTime.strptime("2080-10-24  9:05", "%Y-%m-%d %H:%M")
+        assert (dt.hour, dt.minute) == (9, 5)
+
+    def test_am_pm_noon_midnight(self):
+        """Test 12 AM is midnight, 12 PM is noon, and hours above 12 fail"""
+        assert BSDateTime.strptime("2080-10-24 12:15 AM", "%Y-%m-%d %I:%M %p").hour == 0
+        assert BSDateTime.strptime("2080-10-24 12:15 PM", "%Y-%m-%d %I:%M %p").hour == 12
+        with pytest.raises(ValueError):
+            BSDateTime.strptime("2080-10-24 13:15 PM", "%Y-%m-%d %I:%M %p")
@@ -1,7 +1,7 @@
 """Tests for Sanskrit month name support."""
 
 from nepalify import BSDate, BSDateTime, get_month_name, parse
-from nepalify.text import MONTHS_NEPALI, MONTHS_NEPALI_SANSKRIT
+from nepalify.text import MONTHS_NEPALI_SANSKRIT
 
 
 class TestSanskritMonthNames:
@@ -44,6 +44,13 @@ class TestSanskritMonthNames:
         result = dt.strftime("%N %D, %K", style='sanskrit')
         assert "ज्येष्ठ" in result
     
+    def test_strftime_styles_do_not_share_compiled_format(self):
+        """Test the same format alternates correctly between styles."""
+        date = BSDate(2080, 2, 15)
+        for _ in range(2):
+            assert date.strftime("%N %D, %K") == "जेठ १५, २०८०"
+            assert date.strftime("%N %D, %K", style='sanskrit') == "ज्येष्ठ १५, २०८०"
+    
     def test_parse_formal_nepali(self):
         """Test parser accepts formal Nepali month names."""
         result = parse("जेठ 15, 2080")
@@ -63,6 +63,8 @@ class TestConvertToNepali:
     
     def test_convert_number(self):
         assert convert_to_nepali(123) == "१२३"
+        assert convert_to_nepali(-1.5) == "-१.५"
+        assert convert_to_nepali(123, convert_digits=False) == "123"
     
     def test_convert_day(self):
         result = convert_to_nepali("Sunday")
@@ -72,6 +74,17 @@ class TestConvertToNepali:
         result = convert_to_nepali("sunday")
         assert "आइतबार" in result
     
+    def test_convert_mixed_case_preserves_text(self):
+        result = convert_to_nepali("Due SUNDAY, MaGh", convert_digits=False)
+        assert result == "Due आइतबार, माघ"
+
+    def test_convert_length_changing_lowercase(self):
+        result = convert_to_nepali("İstanbul ſunday Sunday", convert_digits=False)
+        assert result == "İstanbul ſunday आइतबार"
+    
+    def test_convert_whole_words_only(self):
+        assert convert_to_nepali("Sundays") == "Sundays"
+
     def test_convert_bs_month(self):
         result = convert_to_nepali("Magh")
         assert "माघ" in result
@@ -127,3 +140,10 @@ class TestConstants:
     def test_day_names_valid(self):
         assert DAYS_NEPALI[0] == "आइतबार"
         assert DAYS_ENGLISH[0] == "Sunday"
+    
+    def test_constants_are_immutable(self):
+        from nepalify.text.constants import TIME_PERIODS_NEPALI
+        assert isinstance(MONTHS_NEPALI, tuple)
+        assert isinstance(DAYS_ENGLISH, tuple)
+        with pytest.raises(TypeError):
+            TIME_PERIODS_NEPALI['morning'] = 'x'